@@ -9,19 +9,108 @@ By default reads:
 - runs/reference/reference_truth_enriched_clean.csv
 
 This script is intentionally robust to column presence.
+
+The CSV is streamed in chunks (pyarrow batches if installed, else pandas chunksize), so
+memory stays bounded by the distinct-value sets rather than the file size.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import pandas as pd
 
+# scripts/ is not a Python package; add it to sys.path for local imports
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from csv_io import ARROW_CSV_ERRORS, arrow_string_options, pacsv, read_plain_header  # noqa: E402
+
+CHUNK_ROWS = 200_000
+
+
+def iter_truth_arrow(path: Path) -> tuple[list[str], Iterator[pd.DataFrame]]:
+    """Stream the CSV as all-string pyarrow batches. Raises on headers pandas would rename."""
+    header = read_plain_header(path)
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(skip_rows=1, column_names=header, block_size=16 << 20),
+        convert_options=arrow_string_options(header),
+    )
+    return header, (batch.to_pandas().fillna("") for batch in reader)
+
+
+def iter_truth_pandas(path: Path) -> tuple[list[str], Iterator[pd.DataFrame]]:
+    columns = list(pd.read_csv(path, dtype=str, nrows=0).columns)
+    chunks = pd.read_csv(path, dtype=str, low_memory=False, chunksize=CHUNK_ROWS)
+    return columns, (chunk.fillna("") for chunk in chunks)
+
+
+def present(series: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """(stripped values, non-empty mask) from one strip pass; "nan" counts as empty."""
+    s = series.astype(str).str.strip()
+    return s, s.ne("") & s.ne("nan")
+
+
+def chunk_col(chunk: pd.DataFrame, columns: list[str], cache: dict, name: str) -> tuple[pd.Series | None, pd.Series]:
+    """present(chunk[name]) memoized in cache; a missing column is all-empty."""
+    if name not in cache:
+        cache[name] = present(chunk[name]) if name in columns else (None, pd.Series(False, index=chunk.index))
+    return cache[name]
+
+
+def summarize(columns: list[str], chunks: Iterable[pd.DataFrame]) -> dict[str, int]:
+    """Single streaming pass: running row counts and per-column distinct-value sets."""
+    uniq_src = {
+        "unique_titles": "title_norm" if "title_norm" in columns else "title_raw",
+        "unique_isrc": "isrc",
+        "unique_iswc": "iswc",
+    }
+    seen = {k: set() for k, c in uniq_src.items() if c in columns}
+    counts = Counter()
+
+    for chunk in chunks:
+        counts["total_rows"] += len(chunk)
+        # isrc/iswc feed both the distinct sets and rows_with_any_id: strip each column once per chunk
+        cache = {}
 
-def nonempty(series: pd.Series) -> pd.Series:
-    return series.astype(str).str.strip().replace({"nan": ""}).ne("")
+        for key, vals in seen.items():
+            s, mask = chunk_col(chunk, columns, cache, uniq_src[key])
+            vals.update(s[mask].unique())
+
+        if "isrc" in columns or "iswc" in columns:
+            isrc = chunk_col(chunk, columns, cache, "isrc")[1]
+            counts["rows_with_any_id"] += int((isrc | chunk_col(chunk, columns, cache, "iswc")[1]).sum())
+
+        for kind in ("artist", "author", "publisher"):
+            if f"{kind}_tokens" in columns:
+                counts[f"rows_with_{kind}_tokens"] += int(chunk_col(chunk, columns, cache, f"{kind}_tokens")[1].sum())
+
+        if "evidence_tokens" in columns:
+            ev = chunk["evidence_tokens"].astype(str)
+            # crude inference: presence of labels in token blob
+            counts["ev_artist"] += int(ev.str.contains("artist", case=False, na=False).sum())
+            counts["ev_author"] += int(ev.str.contains("author|composer", case=False, na=False, regex=True).sum())
+            counts["ev_publisher"] += int(ev.str.contains("publisher|editora", case=False, na=False, regex=True).sum())
+
+    out = {
+        "total_rows": counts["total_rows"],
+        "unique_titles": len(seen.get("unique_titles", ())),
+        "unique_isrc": len(seen.get("unique_isrc", ())),
+        "unique_iswc": len(seen.get("unique_iswc", ())),
+        "rows_with_any_id": counts["rows_with_any_id"],
+    }
+
+    # If the truth has explicit token columns, use them; otherwise attempt to infer from evidence_tokens
+    tok = [counts[f"rows_with_{k}_tokens"] for k in ("artist", "author", "publisher")]
+    if tok == [0, 0, 0] and "evidence_tokens" in columns:
+        tok = [counts["ev_artist"], counts["ev_author"], counts["ev_publisher"]]
+    out["rows_with_artist_tokens"], out["rows_with_author_tokens"], out["rows_with_publisher_tokens"] = tok
+    return out
 
 
 def main() -> None:
@@ -34,45 +123,25 @@ def main() -> None:
     if not truth_path.is_absolute():
         truth_path = (repo_root / truth_path).resolve()
 
-    df = pd.read_csv(truth_path, dtype=str, low_memory=False).fillna("")
-
-    def uniq(col: str) -> int:
-        if col not in df.columns:
-            return 0
-        s = df[col].astype(str).str.strip().replace({"nan": ""})
-        s = s[s.ne("")]
-        return int(s.nunique())
-
-    total_rows = int(len(df))
-    unique_titles = uniq("title_norm") if "title_norm" in df.columns else uniq("title_raw")
-    unique_isrc = uniq("isrc")
-    unique_iswc = uniq("iswc")
-
-    rows_with_any_id = 0
-    if "isrc" in df.columns or "iswc" in df.columns:
-        isrc = df.get("isrc", "")
-        iswc = df.get("iswc", "")
-        rows_with_any_id = int((nonempty(isrc) | nonempty(iswc)).sum())
-
-    # token fields if present
-    rows_with_artist_tokens = 0
-    rows_with_author_tokens = 0
-    rows_with_publisher_tokens = 0
-
-    # If the truth has explicit token columns, use them; otherwise attempt to infer from evidence_tokens
-    if "artist_tokens" in df.columns:
-        rows_with_artist_tokens = int(nonempty(df["artist_tokens"]).sum())
-    if "author_tokens" in df.columns:
-        rows_with_author_tokens = int(nonempty(df["author_tokens"]).sum())
-    if "publisher_tokens" in df.columns:
-        rows_with_publisher_tokens = int(nonempty(df["publisher_tokens"]).sum())
-
-    if (rows_with_artist_tokens, rows_with_author_tokens, rows_with_publisher_tokens) == (0, 0, 0) and "evidence_tokens" in df.columns:
-        ev = df["evidence_tokens"].astype(str)
-        # crude inference: presence of labels in token blob
-        rows_with_artist_tokens = int(ev.str.contains("artist", case=False, na=False).sum())
-        rows_with_author_tokens = int(ev.str.contains("author|composer", case=False, na=False, regex=True).sum())
-        rows_with_publisher_tokens = int(ev.str.contains("publisher|editora", case=False, na=False, regex=True).sum())
+    stats = None
+    if pacsv is not None:
+        try:
+            columns, chunks = iter_truth_arrow(truth_path)
+            stats = summarize(columns, chunks)
+        except ARROW_CSV_ERRORS:
+            stats = None
+    if stats is None:
+        columns, chunks = iter_truth_pandas(truth_path)
+        stats = summarize(columns, chunks)
+
+    total_rows = stats["total_rows"]
+    unique_titles = stats["unique_titles"]
+    unique_isrc = stats["unique_isrc"]
+    unique_iswc = stats["unique_iswc"]
+    rows_with_any_id = stats["rows_with_any_id"]
+    rows_with_artist_tokens = stats["rows_with_artist_tokens"]
+    rows_with_author_tokens = stats["rows_with_author_tokens"]
+    rows_with_publisher_tokens = stats["rows_with_publisher_tokens"]
 
     out = {
         "truth_path": str(truth_path),
@@ -84,7 +153,7 @@ def main() -> None:
         "rows_with_artist_tokens": rows_with_artist_tokens,
         "rows_with_author_tokens": rows_with_author_tokens,
         "rows_with_publisher_tokens": rows_with_publisher_tokens,
-        "columns": list(df.columns),
+        "columns": columns,
     }
 
     out_dir = truth_path.parent
@@ -8,7 +8,8 @@ Goal
 Inputs
 - --entities: config/top_estelita_entities.csv
 - --root (repeatable): roots to scan
-- --out-dir: output folder (we will create report_package/ inside)
+- --out-dir: output folder (we will create report_package/ inside; per-file scan results are cached
+  in out-dir/.cache and reused while a file's mtime/size are unchanged, unless --no-cache)
 
 Outputs (in out-dir/report_package)
 - entity_lane_hits.csv
@@ -34,17 +35,45 @@ from __future__ import annotations
 
 import argparse
 import re
+import struct
+import sys
 import unicodedata
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+# optional Rust Excel reader; pandas picks openpyxl/xlrd/pyxlsb when unavailable
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+# scripts/ is not a Python package; add it to sys.path for local imports
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from csv_io import (  # noqa: E402
+    ARROW_CSV_ERRORS,
+    arrow_string_options,
+    pa,
+    pacsv,
+    read_plain_header,
+    write_rows_csv,
+)
+from file_cache import cached_call, open_cache  # noqa: E402
+from file_walk import walk_files  # noqa: E402
+from sheet_rows import OPENPYXL_READ_ERRORS  # noqa: E402
+from workers import SERIAL_BELOW_FILES, pool_workers  # noqa: E402
 
 # --- normalization ---
 _NON_ALNUM = re.compile(r"[^0-9a-z]+")
-_WS = re.compile(r"\s+")
 
 
 def strip_accents(s: str) -> str:
@@ -52,37 +81,91 @@ def strip_accents(s: str) -> str:
     return "".join(ch for ch in s if not unicodedata.combining(ch))
 
 
+@lru_cache(maxsize=262144)
 def norm_text(s: str) -> str:
     s = "" if s is None else str(s)
     s = strip_accents(s.casefold())
-    s = _NON_ALNUM.sub(" ", s)
-    s = _WS.sub(" ", s).strip()
-    return s
+    # whitespace runs are non-alnum runs too, so this one pass also collapses them
+    s = _NON_ALNUM.sub(" ", s).strip()
+    return sys.intern(s)
 
 
 def tokenize_norm(s: str) -> list[str]:
     s = norm_text(s)
-    return [t for t in s.split(" ") if t]
+    return [sys.intern(t) for t in s.split(" ") if t]
 
 
 def joined_norm(s: str) -> str:
     return "".join(tokenize_norm(s))
 
 
+DUDU_FALCAO = "dudu falcao"
+
+Prepped = tuple[frozenset[str], str, str]
+
+
+@lru_cache(maxsize=262144)
+def _prep_cell(v: str) -> Prepped:
+    """Normalize a cell once: (token set, normalized text, joined form)."""
+    t = norm_text(v)
+    # interned so set ops against entity tokens hit the identity fast path
+    toks = [sys.intern(x) for x in t.split(" ") if x]
+    return frozenset(toks), t, "".join(toks)
+
+
+# --- per-entity matchers (module-level so Entity stays picklable for the process pool) ---
+def _match_never(prepped: Prepped) -> bool:
+    return False
+
+
+def _match_dudu(prepped: Prepped) -> bool:
+    # special rule: dudu only if falcao present (also joined form)
+    _, t, jt = prepped
+    return ("dudu" in t and "falcao" in t) or "dudufalcao" in jt
+
+
+def _match_tokens(tokens_fs: frozenset[str], prepped: Prepped) -> bool:
+    return tokens_fs <= prepped[0]
+
+
+def _match_tokens_or_joined(tokens_fs: frozenset[str], joined: str, prepped: Prepped) -> bool:
+    return tokens_fs <= prepped[0] or joined in prepped[2]
+
+
 @dataclass(frozen=True)
 class Entity:
     entity_raw: str
     entity_norm: str
     entity_type: str
     priority: int
-
-    @property
-    def tokens(self) -> tuple[str, ...]:
-        return tuple(tokenize_norm(self.entity_norm))
-
-    @property
-    def joined(self) -> str:
-        return "".join(self.tokens)
+    # derived once in __post_init__
+    tokens: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    tokens_fs: frozenset[str] = field(init=False, repr=False, compare=False)
+    joined: str = field(init=False, repr=False, compare=False)
+    matcher: Callable[[Prepped], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        toks = tuple(tokenize_norm(self.entity_norm))
+        joined = "".join(toks)
+        if self.entity_norm == DUDU_FALCAO:
+            matcher = _match_dudu
+        elif not toks:
+            matcher = _match_never
+        elif self.priority >= 4:
+            # joined form only for priority>=4
+            matcher = partial(_match_tokens_or_joined, frozenset(toks), joined)
+        else:
+            matcher = partial(_match_tokens, frozenset(toks))
+        object.__setattr__(self, "tokens", toks)
+        object.__setattr__(self, "tokens_fs", frozenset(toks))
+        object.__setattr__(self, "joined", joined)
+        object.__setattr__(self, "matcher", matcher)
+
+
+def match_prepped(ent: Entity, prepped: Prepped) -> bool:
+    if not prepped[1]:
+        return False
+    return ent.matcher(prepped)
 
 
 CANDIDATE_COL_RX = re.compile(
@@ -92,33 +175,49 @@ CANDIDATE_COL_RX = re.compile(
     re.IGNORECASE,
 )
 
+
+@lru_cache(maxsize=65536)
+def is_candidate_col(name: str) -> bool:
+    # memoized per header (headers repeat across sheets/files); stays a substring regex
+    # rather than a token-set lookup because it must hit inside "coautores", "participacao"...
+    return CANDIDATE_COL_RX.search(name) is not None
+
+
 ROW_BLOB_SHEET_RX = re.compile(r"ubem|relat|mcs|cue|canais\s*globo", re.IGNORECASE)
 
 TARGET_PROVIDERS = {"ubem", "globo", "globoplay", "deezer", "una"}
 
-# Provider guess (for ROW_BLOB fallback gating)
-_PROVIDER_RX = [
-    ("band", re.compile(r"\bband\b|bandeirantes", re.I)),
-    ("sbt", re.compile(r"\bsbt\b", re.I)),
-    ("globo", re.compile(r"\bglobo\b|canais globo|globonews", re.I)),
-    ("globoplay", re.compile(r"globoplay", re.I)),
-    ("ubem", re.compile(r"ubem", re.I)),
-    ("deezer", re.compile(r"deezer", re.I)),
-    ("una", re.compile(r"\buna\b", re.I)),
+# Provider guess (for ROW_BLOB fallback gating), in priority order
+_PROVIDER_PATTERNS = [
+    ("band", r"\bband\b|bandeirantes"),
+    ("sbt", r"\bsbt\b"),
+    ("globo", r"\bglobo\b|canais globo|globonews"),
+    ("globoplay", r"globoplay"),
+    ("ubem", r"ubem"),
+    ("deezer", r"deezer"),
+    ("una", r"\buna\b"),
 ]
+# One regex: start-anchored lookaheads are tried in list order, so the first provider that
+# matches anywhere wins (same as testing the patterns one by one); lastgroup names it.
+_PROVIDER_RX = re.compile(
+    "^(?:" + "|".join(f"(?=.*?(?P<{name}>{rx}))" for name, rx in _PROVIDER_PATTERNS) + ")",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
+@lru_cache(maxsize=100_000)
 def guess_provider(path: str) -> str:
-    s = str(path)
-    for name, rx in _PROVIDER_RX:
-        if rx.search(s):
-            return name
-    return "other"
+    m = _PROVIDER_RX.match(str(path))
+    return m.lastgroup if m else "other"
+
+
+# looks_like_contributor_list only inspects this many leading values
+CONTRIBUTOR_SAMPLE_ROWS = 50
 
 
 def looks_like_contributor_list(values: list[str]) -> bool:
     # heuristics: commas / hyphens / percents / multiple tokens
-    for v in values[:50]:
+    for v in values[:CONTRIBUTOR_SAMPLE_ROWS]:
         s = str(v)
         if not s.strip():
             continue
@@ -130,6 +229,7 @@ def looks_like_contributor_list(values: list[str]) -> bool:
     return False
 
 
+@lru_cache(maxsize=100_000)
 def lane_for_path(p: str) -> str:
     s = str(p)
     if "/dedup/unique/" in s:
@@ -171,34 +271,155 @@ def load_entities(path: Path) -> list[Entity]:
 
 
 def match_entity(ent: Entity, text: str) -> bool:
-    t = norm_text(text)
-    if not t:
-        return False
+    return match_prepped(ent, _prep_cell(text))
 
-    # special rule: dudu only if falcao present
-    if ent.entity_norm == "dudu falcao":
-        if "dudu" in t and "falcao" in t:
-            return True
-        # also joined form
-        if "dudufalcao" in joined_norm(t):
-            return True
-        return False
 
-    toks = ent.tokens
-    if not toks:
-        return False
+@dataclass(frozen=True)
+class EntityIndex:
+    """All entities compiled for a single pass per cell (see match_all)."""
 
-    tset = set(tokenize_norm(t))
-    if all(tok in tset for tok in toks):
-        return True
+    vocab: dict[str, int]  # entity token -> bit
+    token_masks: tuple[tuple[int, tuple[str, ...]], ...]  # (all-tokens mask, entity_norms)
+    joined_rx: re.Pattern[str] | None
+    by_joined: dict[str, tuple[Entity, ...]]
+    has_dudu: bool
 
-    # joined form only for priority>=4
-    if ent.priority >= 4:
-        jt = joined_norm(t)
-        if ent.joined and ent.joined in jt:
-            return True
 
-    return False
+def build_entity_index(entities: list[Entity]) -> EntityIndex:
+    vocab = {}
+    by_mask = defaultdict(list)
+    joined_ents = defaultdict(list)
+    has_dudu = False
+    for ent in entities:
+        if ent.entity_norm == DUDU_FALCAO:
+            has_dudu = True
+            continue
+        if not ent.tokens:
+            continue
+        mask = 0
+        for tok in ent.tokens:
+            mask |= 1 << vocab.setdefault(tok, len(vocab))
+        by_mask[mask].append(ent.entity_norm)
+        if ent.priority >= 4 and ent.joined:
+            joined_ents[ent.joined].append(ent)
+
+    # One overlapping, longest-first alternation over all joined forms. At each
+    # position it reports the longest form present; every shorter form starting
+    # there is a prefix of it, so by_joined maps a form to all prefix-forms' entities.
+    forms = sorted(joined_ents, key=len, reverse=True)
+    joined_rx = None
+    by_joined = {}
+    if forms:
+        joined_rx = re.compile("(?=(" + "|".join(re.escape(f) for f in forms) + "))")
+        for f in forms:
+            by_joined[f] = tuple(e for g in forms if f.startswith(g) for e in joined_ents[g])
+
+    return EntityIndex(
+        vocab=vocab,
+        token_masks=tuple((m, tuple(v)) for m, v in by_mask.items()),
+        joined_rx=joined_rx,
+        by_joined=by_joined,
+        has_dudu=has_dudu,
+    )
+
+
+def cell_token_mask(vocab: dict[str, int], tokens: frozenset[str]) -> int:
+    """Bit i set when the cell contains the entity token numbered i in vocab."""
+    mask = 0
+    for tok in tokens:
+        i = vocab.get(tok)
+        if i is not None:
+            mask |= 1 << i
+    return mask
+
+
+def match_all(index: EntityIndex, prepped: Prepped) -> set[str]:
+    """entity_norm of every entity that match_prepped() would accept for this cell."""
+    tset, t, jt = prepped
+    out = set()
+    if not t:
+        return out
+
+    cell_mask = cell_token_mask(index.vocab, tset)
+    if cell_mask:
+        for m, norms in index.token_masks:
+            if cell_mask & m == m:
+                out.update(norms)
+
+    if index.joined_rx is not None:
+        for m in index.joined_rx.finditer(jt):
+            out.update(e.entity_norm for e in index.by_joined[m.group(1)])
+
+    if index.has_dudu and _match_dudu(prepped):
+        out.add(DUDU_FALCAO)
+
+    return out
+
+
+def scan_values(index: EntityIndex, values: list[str] | np.ndarray) -> dict[str, list[int]]:
+    """entity_norm -> positions of matching values.
+
+    Columns repeat the same contributor strings a lot, so values are factorized first and
+    each distinct value is matched once; positions are recovered from the codes.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+    prepped = [_prep_cell(u) for u in uniques]
+    ent_codes = defaultdict(set)
+    if len(index.vocab) > 64:
+        for code, pc in enumerate(prepped):
+            for en in match_all(index, pc):
+                ent_codes[en].add(code)
+    else:
+        # all-tokens rule for every (distinct value, entity mask) pair in one uint64 AND
+        if index.token_masks:
+            cells = np.fromiter(
+                (cell_token_mask(index.vocab, pc[0]) for pc in prepped), dtype=np.uint64, count=len(prepped)
+            )
+            ents = np.array([m for m, _ in index.token_masks], dtype=np.uint64)
+            hit = (cells[:, None] & ents) == ents
+            for k in np.flatnonzero(hit.any(axis=0)):
+                cs = np.flatnonzero(hit[:, k]).tolist()
+                for en in index.token_masks[k][1]:
+                    ent_codes[en].update(cs)
+        # joined-form and dudu rules stay per value
+        for code, pc in enumerate(prepped):
+            if not pc[1]:
+                continue
+            if index.joined_rx is not None:
+                for m in index.joined_rx.finditer(pc[2]):
+                    for e in index.by_joined[m.group(1)]:
+                        ent_codes[e.entity_norm].add(code)
+            if index.has_dudu and _match_dudu(pc):
+                ent_codes[DUDU_FALCAO].add(code)
+    return {en: np.flatnonzero(np.isin(codes, list(cs))).tolist() for en, cs in ent_codes.items()}
+
+
+def read_csv_arrow(path: Path, *, encoding: str, sep: str, max_rows: int | None = None) -> pd.DataFrame:
+    """All-string CSV read via pyarrow (streamed, stops after max_rows); raises on any parse problem.
+
+    Headers pandas would rename (see read_plain_header) raise too, so pandas reads those files.
+    """
+    header = read_plain_header(path, encoding=encoding, sep=sep)
+    names = [f"f{i}" for i in range(len(header))]
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(encoding=encoding, skip_rows=1, column_names=names, block_size=8 << 20),
+        parse_options=pacsv.ParseOptions(delimiter=sep),
+        convert_options=arrow_string_options(names),
+    )
+    batches = []
+    n = 0
+    for batch in reader:
+        batches.append(batch)
+        n += batch.num_rows
+        if max_rows is not None and n >= max_rows:
+            break
+    tbl = pa.Table.from_batches(batches, schema=reader.schema)
+    if max_rows is not None:
+        tbl = tbl.slice(0, max_rows)
+    df = tbl.to_pandas().fillna("")
+    df.columns = header
+    return df
 
 
 def probe_csv(path: Path, *, max_rows: int) -> tuple[list[str], pd.DataFrame]:
@@ -207,6 +428,12 @@ def probe_csv(path: Path, *, max_rows: int) -> tuple[list[str], pd.DataFrame]:
     last = None
     for enc in encs:
         for sep in seps:
+            if pacsv is not None:
+                try:
+                    df = read_csv_arrow(path, encoding=enc, sep=sep, max_rows=max_rows)
+                    return [str(c) for c in df.columns], df
+                except ARROW_CSV_ERRORS:
+                    pass
             try:
                 df = pd.read_csv(path, dtype=str, nrows=max_rows, low_memory=False, encoding=enc, sep=sep).fillna("")
                 return [str(c) for c in df.columns], df
@@ -216,6 +443,264 @@ def probe_csv(path: Path, *, max_rows: int) -> tuple[list[str], pd.DataFrame]:
     raise last or RuntimeError("csv probe failed")
 
 
+def candidate_columns(df: pd.DataFrame) -> list[str]:
+    """People/entity columns to scan: header regex hits plus contributor-like Unnamed columns."""
+    cols = [str(c) for c in df.columns]
+
+    # Candidate columns by header regex
+    cand_cols = [c for c in cols if is_candidate_col(c)]
+
+    # Include Unnamed columns if they look like contributor lists
+    unnamed = [c for c in cols if str(c).lower().startswith('unnamed')]
+    for c in unnamed:
+        try:
+            vals = df[c].to_numpy()[:CONTRIBUTOR_SAMPLE_ROWS]
+            if looks_like_contributor_list(vals):
+                cand_cols.append(c)
+        except Exception:
+            continue
+
+    # de-dupe + cap
+    return list(dict.fromkeys(cand_cols))[:50]
+
+
+def _filled_width(row: tuple) -> int:
+    """Length of row without its trailing None / "" cells."""
+    n = len(row)
+    while n and row[n - 1] in (None, ""):
+        n -= 1
+    return n
+
+
+def peek_excel_headers(p: Path, *, max_sheets: int) -> list[tuple[str, list[str]]] | None:
+    """(sheet, header row) for the first max_sheets sheets without a pandas parse.
+
+    Header cells are str() of the first row the pandas reader would use; blank cells (and
+    cells past the header but within the sheet width) come back as "". Returns None when the
+    format/engine is unsupported or anything looks off, so callers fall back to parsing.
+    """
+    suffix = p.suffix.lower()
+    if suffix == ".xlsx":
+        import openpyxl
+
+        try:
+            wb = openpyxl.load_workbook(p, read_only=True, data_only=True, keep_links=False)
+            try:
+                out = []
+                # worksheets, like pandas' sheet_names, leaves chartsheets out
+                for ws in wb.worksheets[:max_sheets]:
+                    # the declared <dimension> may be stale (ref="A1"); pandas' reader ignores it too
+                    reset = getattr(ws, "reset_dimensions", None)
+                    if reset is None:
+                        return None
+                    reset()
+                    # width as pandas sees it: trailing blanks trimmed per row. Unnamed columns
+                    # only become candidates from their first CONTRIBUTOR_SAMPLE_ROWS values
+                    rows = list(ws.iter_rows(max_row=1 + CONTRIBUTOR_SAMPLE_ROWS, values_only=True))
+                    width = max((_filled_width(r) for r in rows), default=0)
+                    header = ["" if v is None else str(v) for v in rows[0][:width]] if rows else []
+                    out.append((ws.title, header + [""] * (width - len(header))))
+                return out
+            finally:
+                wb.close()
+        except OPENPYXL_READ_ERRORS:
+            return None
+    if suffix == ".xls":
+        try:
+            import xlrd
+            from xlrd.compdoc import CompDocError
+        except ImportError:
+            return None
+
+        try:
+            book = xlrd.open_workbook(str(p), on_demand=True)
+            try:
+                out = []
+                for name in book.sheet_names()[:max_sheets]:
+                    sh = book.sheet_by_name(name)
+                    row = sh.row_values(0) if sh.nrows else []
+                    header = [str(v) if v not in (None, "") else "" for v in row]
+                    out.append((name, header + [""] * (sh.ncols - len(header))))
+                return out
+            finally:
+                book.release_resources()
+        # corrupt OLE2 containers and BIFF records fail in all of these
+        except (OSError, ArithmeticError, LookupError, ValueError, AssertionError, struct.error, CompDocError, xlrd.XLRDError):
+            return None
+    return None
+
+
+def header_may_have_candidates(header: list[str]) -> bool:
+    """True if the sheet could yield candidate columns (regex hit or blank/Unnamed header)."""
+    for h in header:
+        h = h.strip()
+        if not h or h.lower().startswith("unnamed") or is_candidate_col(h):
+            return True
+    return False
+
+
+def scan_file(
+    p: Path,
+    *,
+    entities: list[Entity],
+    index: EntityIndex,
+    max_sheets: int,
+    max_rows: int,
+    hits_cap: int,
+    variants_cap: int,
+) -> tuple[list[dict], list[dict]]:
+    """Probe and scan one file; returns (hits_rows, variants_rows) for that file only.
+
+    variants_rows is capped at variants_cap per file; the driver applies the global cap.
+    """
+    lane = lane_for_path(str(p))
+    provider_guess = guess_provider(str(p))
+
+    # normalization caches are per file (bounded memory)
+    _prep_cell.cache_clear()
+    norm_text.cache_clear()
+
+    hits_rows = []
+    variants_rows = []
+    variants_seen = set()
+
+    # Probe
+    try:
+        if p.suffix.lower() in {".csv", ".tsv"}:
+            cols, df = probe_csv(p, max_rows=max_rows)
+            sheets = [("csv", df)]
+        else:
+            # cheap header peek: only sheets that can produce hits get the full parse
+            peek = peek_excel_headers(p, max_sheets=max_sheets)
+            wanted = None
+            if peek is not None:
+                row_blob_file = provider_guess in TARGET_PROVIDERS
+                wanted = {
+                    sh
+                    for sh, header in peek
+                    if row_blob_file or ROW_BLOB_SHEET_RX.search(sh) or header_may_have_candidates(header)
+                }
+                if not wanted:
+                    return hits_rows, variants_rows
+
+            xl = pd.ExcelFile(p, engine=EXCEL_ENGINE)
+            sheets = []
+            for sh in xl.sheet_names[:max_sheets]:
+                if wanted is not None and sh not in wanted:
+                    continue
+                try:
+                    if wanted is None and not (provider_guess in TARGET_PROVIDERS or ROW_BLOB_SHEET_RX.search(sh)):
+                        # no header peek for this format: a short pre-read decides the same
+                        # candidate columns as the full parse (Unnamed ones are judged on
+                        # their first CONTRIBUTOR_SAMPLE_ROWS values)
+                        head = xl.parse(sh, dtype=str, nrows=CONTRIBUTOR_SAMPLE_ROWS).fillna("")
+                        if not candidate_columns(head):
+                            continue
+                    df = xl.parse(sh, dtype=str, nrows=max_rows).fillna("")
+                    sheets.append((sh, df))
+                except Exception:
+                    continue
+    except Exception:
+        return hits_rows, variants_rows
+
+    for sh, df in sheets:
+        cand_cols = candidate_columns(df)
+
+        if cand_cols:
+            # one pass per column matches all entities at once
+            col_scan = {}
+            for c in cand_cols:
+                raw = df[c].to_numpy()
+                col_scan[c] = (raw, scan_values(index, raw))
+
+            # scan each entity within candidate cols
+            for ent in entities:
+                cap = hits_cap
+                hit_ct = 0
+                hit_cols = Counter()
+
+                for c in cand_cols:
+                    raw, rows_by_ent = col_scan[c]
+                    for i in rows_by_ent.get(ent.entity_norm, [])[: cap - hit_ct]:
+                        v = raw[i]
+                        hit_ct += 1
+                        hit_cols[c] += 1
+                        # variants
+                        key = (ent.entity_norm, lane, str(p), sh, c, v)
+                        if len(variants_rows) < variants_cap and key not in variants_seen:
+                            variants_seen.add(key)
+                            variants_rows.append(
+                                {
+                                    "entity_norm": ent.entity_norm,
+                                    "lane": lane,
+                                    "file_path": str(p),
+                                    "sheet": sh,
+                                    "hit_field": c,
+                                    "raw_variant": v,
+                                }
+                            )
+                    if hit_ct >= cap:
+                        break
+
+                if hit_ct:
+                    hits_rows.append(
+                        {
+                            "entity_norm": ent.entity_norm,
+                            "lane": lane,
+                            "file_path": str(p),
+                            "sheet": sh,
+                            "hit_field": ";".join([f"{k}:{v}" for k, v in hit_cols.most_common(10)]),
+                            "hit_count": hit_ct,
+                        }
+                    )
+
+        # ROW_BLOB fallback for targeted subset
+        if (provider_guess in TARGET_PROVIDERS) or ROW_BLOB_SHEET_RX.search(sh):
+            # cap 3 sheets total for row_blob
+            # Build blob per row for up to max_rows
+            try:
+                # use at most first 50 columns to keep it cheap
+                arr = df.iloc[:max_rows, :50].astype(str).to_numpy()
+                blobs = [" | ".join([x for x in row if x and x != "nan"]) for row in arr]
+            except Exception:
+                continue
+
+            blob_rows_by_ent = scan_values(index, blobs)
+
+            for ent in entities:
+                cap = hits_cap
+                hit_ct = 0
+                for i in blob_rows_by_ent.get(ent.entity_norm, [])[:cap]:
+                    blob = blobs[i]
+                    hit_ct += 1
+                    key = (ent.entity_norm, lane, str(p), sh, 'ROW_BLOB', blob)
+                    if len(variants_rows) < variants_cap and key not in variants_seen:
+                        variants_seen.add(key)
+                        variants_rows.append(
+                            {
+                                "entity_norm": ent.entity_norm,
+                                "lane": lane,
+                                "file_path": str(p),
+                                "sheet": sh,
+                                "hit_field": "ROW_BLOB",
+                                "raw_variant": blob[:300],
+                            }
+                        )
+                if hit_ct:
+                    hits_rows.append(
+                        {
+                            "entity_norm": ent.entity_norm,
+                            "lane": lane,
+                            "file_path": str(p),
+                            "sheet": sh,
+                            "hit_field": "ROW_BLOB",
+                            "hit_count": hit_ct,
+                        }
+                    )
+
+    return hits_rows, variants_rows
+
+
 def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--entities", default="config/top_estelita_entities.csv")
@@ -225,6 +710,13 @@ def main() -> None:
     ap.add_argument("--max-rows", type=int, default=5000)
     ap.add_argument("--hits-cap-per-entity-per-file", type=int, default=200)
     ap.add_argument("--variants-cap", type=int, default=500)
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help=f"scan processes (0 = serial below {SERIAL_BELOW_FILES} files, else cpu count; 1 = serial)",
+    )
+    ap.add_argument("--no-cache", action="store_true", help="rescan every file, ignoring out-dir/.cache")
     args = ap.parse_args()
 
     repo_root = Path(__file__).resolve().parent.parent
@@ -233,6 +725,7 @@ def main() -> None:
         ent_path = (repo_root / ent_path).resolve()
 
     entities = load_entities(ent_path)
+    index = build_entity_index(entities)
 
     out_dir = Path(args.out_dir).expanduser()
     pkg = out_dir / "report_package"
@@ -250,174 +743,70 @@ def main() -> None:
 
     hits_rows = []
     variants_rows = []
-    variants_seen = set()
 
     # per entity aggregation
     ent_lane_hits = defaultdict(lambda: Counter())  # entity -> lane -> hits
     ent_file_hits = defaultdict(Counter)  # entity -> file -> hits
 
+    if not have_xlsb:
+        exts.discard(".xlsb")
+
+    paths = []
     for root in [Path(r).expanduser() for r in args.root]:
         if not root.exists():
             continue
-        for p in root.rglob("*"):
-            if not p.is_file():
-                continue
-            if p.suffix.lower() not in exts:
-                continue
-            if p.suffix.lower() == ".xlsb" and not have_xlsb:
-                continue
-
-            lane = lane_for_path(str(p))
-
-            # Probe
-            try:
-                if p.suffix.lower() in {".csv", ".tsv"}:
-                    cols, df = probe_csv(p, max_rows=args.max_rows)
-                    sheets = [("csv", df)]
-                else:
-                    xl = pd.ExcelFile(p)
-                    sheets = []
-                    for sh in xl.sheet_names[: args.max_sheets]:
-                        try:
-                            df = xl.parse(sh, dtype=str, nrows=args.max_rows).fillna("")
-                            sheets.append((sh, df))
-                        except Exception:
-                            continue
-            except Exception:
-                continue
-
-            for sh, df in sheets:
-                cols = [str(c) for c in df.columns]
-
-                # Candidate columns by header regex
-                cand_cols = [c for c in cols if CANDIDATE_COL_RX.search(c)]
-
-                # Include Unnamed columns if they look like contributor lists
-                unnamed = [c for c in cols if str(c).lower().startswith('unnamed')]
-                for c in unnamed:
-                    try:
-                        vals = df[c].astype(str).tolist()[:200]
-                        if looks_like_contributor_list(vals):
-                            cand_cols.append(c)
-                    except Exception:
-                        continue
-
-                # de-dupe + cap
-                cand_cols = list(dict.fromkeys(cand_cols))[:50]
-
-                if cand_cols:
-                    # scan each entity within candidate cols
-                    for ent in entities:
-                        cap = args.hits_cap_per_entity_per_file
-                        hit_ct = 0
-                        hit_cols = Counter()
-
-                        for c in cand_cols:
-                            ser = df[c].astype(str).tolist()
-                            for v in ser:
-                                if hit_ct >= cap:
-                                    break
-                                if not str(v).strip():
-                                    continue
-                                if match_entity(ent, v):
-                                    hit_ct += 1
-                                    hit_cols[c] += 1
-                                    # variants
-                                    key = (ent.entity_norm, lane, str(p), sh, c, v)
-                                    if len(variants_rows) < args.variants_cap and key not in variants_seen:
-                                        variants_seen.add(key)
-                                        variants_rows.append(
-                                            {
-                                                "entity_norm": ent.entity_norm,
-                                                "lane": lane,
-                                                "file_path": str(p),
-                                                "sheet": sh,
-                                                "hit_field": c,
-                                                "raw_variant": v,
-                                            }
-                                        )
-                            if hit_ct >= cap:
-                                break
-
-                        if hit_ct:
-                            hits_rows.append(
-                                {
-                                    "entity_norm": ent.entity_norm,
-                                    "lane": lane,
-                                    "file_path": str(p),
-                                    "sheet": sh,
-                                    "hit_field": ";".join([f"{k}:{v}" for k, v in hit_cols.most_common(10)]),
-                                    "hit_count": hit_ct,
-                                }
-                            )
-                            ent_lane_hits[ent.entity_norm][lane] += hit_ct
-                            ent_file_hits[ent.entity_norm][str(p)] += hit_ct
-
-                # ROW_BLOB fallback for targeted subset
-                provider_guess = guess_provider(str(p))
-                if (provider_guess in TARGET_PROVIDERS) or ROW_BLOB_SHEET_RX.search(sh):
-                    # cap 3 sheets total for row_blob
-                    # Build blob per row for up to max_rows
-                    try:
-                        # use at most first 50 columns to keep it cheap
-                        df2 = df.iloc[: args.max_rows, :50].astype(str)
-                        blobs = (df2.apply(lambda row: " | ".join([x for x in row.tolist() if x and x != 'nan']), axis=1)).tolist()
-                    except Exception:
-                        continue
-
-                    for ent in entities:
-                        cap = args.hits_cap_per_entity_per_file
-                        hit_ct = 0
-                        for blob in blobs:
-                            if hit_ct >= cap:
-                                break
-                            if match_entity(ent, blob):
-                                hit_ct += 1
-                                key = (ent.entity_norm, lane, str(p), sh, 'ROW_BLOB', blob)
-                                if len(variants_rows) < args.variants_cap and key not in variants_seen:
-                                    variants_seen.add(key)
-                                    variants_rows.append(
-                                        {
-                                            "entity_norm": ent.entity_norm,
-                                            "lane": lane,
-                                            "file_path": str(p),
-                                            "sheet": sh,
-                                            "hit_field": "ROW_BLOB",
-                                            "raw_variant": blob[:300],
-                                        }
-                                    )
-                        if hit_ct:
-                            hits_rows.append(
-                                {
-                                    "entity_norm": ent.entity_norm,
-                                    "lane": lane,
-                                    "file_path": str(p),
-                                    "sheet": sh,
-                                    "hit_field": "ROW_BLOB",
-                                    "hit_count": hit_ct,
-                                }
-                            )
-                            ent_lane_hits[ent.entity_norm][lane] += hit_ct
-                            ent_file_hits[ent.entity_norm][str(p)] += hit_ct
-
-            # end sheets
+        paths.extend(walk_files(root, exts))
+
+    scan = partial(
+        scan_file,
+        entities=entities,
+        index=index,
+        max_sheets=args.max_sheets,
+        max_rows=args.max_rows,
+        hits_cap=args.hits_cap_per_entity_per_file,
+        variants_cap=args.variants_cap,
+    )
+    if not args.no_cache:
+        cache_dir = open_cache(
+            out_dir / ".cache",
+            "audit_entity_lanes",
+            [(e.entity_raw, e.entity_norm, e.entity_type, e.priority) for e in entities],
+            {
+                "max_sheets": args.max_sheets,
+                "max_rows": args.max_rows,
+                "hits_cap": args.hits_cap_per_entity_per_file,
+                "variants_cap": args.variants_cap,
+            },
+        )
+        scan = partial(cached_call, scan, cache_dir=cache_dir)
+    workers = pool_workers(args.workers, len(paths))
+    if workers == 1:
+        results = [scan(p) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(scan, paths, chunksize=4))
+
+    for file_hits, file_variants in results:
+        for r in file_hits:
+            hits_rows.append(r)
+            ent_lane_hits[r["entity_norm"]][r["lane"]] += r["hit_count"]
+            ent_file_hits[r["entity_norm"]][r["file_path"]] += r["hit_count"]
+        variants_rows.extend(file_variants[: max(0, args.variants_cap - len(variants_rows))])
 
     # write hits
-    hits_df = pd.DataFrame(hits_rows)
     hits_csv = pkg / "entity_lane_hits.csv"
-    hits_df.to_csv(hits_csv, index=False)
+    write_rows_csv(hits_rows, hits_csv)
 
     # raw variants
-    vars_df = pd.DataFrame(variants_rows).head(args.variants_cap)
     vars_csv = pkg / "entity_lane_raw_variants.csv"
-    vars_df.to_csv(vars_csv, index=False)
+    write_rows_csv(variants_rows[: args.variants_cap], vars_csv)
 
     # per entity top files
     top_rows = []
     for ent, file_counts in ent_file_hits.items():
         for fp, ct in file_counts.most_common(50):
             top_rows.append({"entity_norm": ent, "file_path": fp, "hit_count": ct})
-    (pd.DataFrame(top_rows)).to_csv(pkg / "entity_lane_top_files.csv", index=False)
+    write_rows_csv(top_rows, pkg / "entity_lane_top_files.csv")
 
     # zero reasons
     z = []
@@ -425,7 +814,7 @@ def main() -> None:
         if ent_file_hits.get(ent.entity_norm):
             continue
         z.append({"entity_norm": ent.entity_norm, "reason": "scanned_no_hits"})
-    pd.DataFrame(z).to_csv(pkg / "entity_lane_zero_reasons.csv", index=False)
+    write_rows_csv(z, pkg / "entity_lane_zero_reasons.csv")
 
     # summary
     lines = []
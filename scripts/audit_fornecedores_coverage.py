@@ -19,49 +19,86 @@ import argparse
 import csv
 import fnmatch
 import hashlib
+import itertools
+import os
 import re
 import shutil
+import sys
 import unicodedata
 import zipfile
 from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
 
+# scripts/ is not a Python package; add it to sys.path for local imports
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from file_cache import cached_call, open_cache  # noqa: E402
+from sheet_rows import OPENPYXL_READ_ERRORS  # noqa: E402
+
+# optional Rust Excel reader; pandas picks openpyxl/xlrd/pyxlsb when unavailable
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
 
 EXTS_SUPPORTED = {"xlsx", "xls", "csv", "zip"}
 
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "sharkclaw"
+
+# in priority order: the first provider whose pattern matches the path wins
 PROVIDERS = [
-    ("band", re.compile(r"\bband\b|bandeirantes", re.I)),
-    ("sbt", re.compile(r"\bsbt\b", re.I)),
-    ("globo", re.compile(r"\bglobo\b|canais globo", re.I)),
-    ("globoplay", re.compile(r"globoplay", re.I)),
-    ("record", re.compile(r"\brecord\b", re.I)),
-    ("canalbrasil", re.compile(r"canal\s*brasil", re.I)),
-    ("ubem", re.compile(r"ubem", re.I)),
-    ("ecad", re.compile(r"ecad", re.I)),
+    ("band", r"\bband\b|bandeirantes"),
+    ("sbt", r"\bsbt\b"),
+    ("globo", r"\bglobo\b|canais globo"),
+    ("globoplay", r"globoplay"),
+    ("record", r"\brecord\b"),
+    ("canalbrasil", r"canal\s*brasil"),
+    ("ubem", r"ubem"),
+    ("ecad", r"ecad"),
 ]
+# One regex: start-anchored lookaheads are tried in list order, so the first provider that
+# matches anywhere wins (same as testing the patterns one by one); lastgroup names it.
+PROVIDER_RX = re.compile(
+    "^(?:" + "|".join(f"(?=.*?(?P<{name}>{rx}))" for name, rx in PROVIDERS) + ")",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
 def guess_provider(path: Path) -> str:
-    s = str(path)
-    for name, rx in PROVIDERS:
-        if rx.search(s):
-            return name
-    return "other"
+    m = PROVIDER_RX.match(str(path))
+    return m.lastgroup if m else "other"
+
+
+class _CombiningMarks(dict):
+    """str.translate table deleting combining marks; each code point is classified once, on first use."""
+
+    def __missing__(self, cp: int) -> int | None:
+        self[cp] = None if unicodedata.combining(chr(cp)) else cp
+        return self[cp]
+
+
+_STRIP_COMBINING = _CombiningMarks()
+_WS = re.compile(r"\s+")
 
 
 def strip_accents(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s)
-    return "".join(ch for ch in s if not unicodedata.combining(ch))
+    return unicodedata.normalize("NFKD", s).translate(_STRIP_COMBINING)
 
 
 def norm(s: str) -> str:
     s = "" if s is None else str(s)
     s = strip_accents(s.casefold().strip())
-    s = re.sub(r"\s+", " ", s)
+    s = _WS.sub(" ", s)
     return s
 
 
@@ -161,9 +198,60 @@ def load_exclude_globs(path: Path) -> list[str]:
     return globs
 
 
-def is_excluded(p: Path, globs: list[str]) -> bool:
+@dataclass(frozen=True)
+class ExcludeGlobs:
+    """Exclude globs compiled once: plain "*.ext" globs as a suffix set, the rest as one regex."""
+
+    suffixes: frozenset[str]
+    rx: re.Pattern[str] | None
+
+
+def compile_exclude_globs(globs: list[str]) -> ExcludeGlobs:
+    suffixes = set()
+    rest = []
+    for g in globs:
+        tail = g[1:]
+        if g.startswith("*.") and tail.count(".") == 1 and not any(ch in tail for ch in "*?[/"):
+            suffixes.add(tail)
+        else:
+            rest.append(g)
+    rx = re.compile("|".join(f"(?:{fnmatch.translate(g)})" for g in rest)) if rest else None
+    return ExcludeGlobs(frozenset(suffixes), rx)
+
+
+def is_excluded(p: Path | str, excludes: ExcludeGlobs) -> bool:
+    """Same answer as any(fnmatch.fnmatch(str(p), g) for g in globs)."""
     s = str(p)
-    return any(fnmatch.fnmatch(s, g) for g in globs)
+    if excludes.suffixes:
+        dot = s.rfind(".")
+        if dot != -1 and s[dot:] in excludes.suffixes:
+            return True
+    return excludes.rx is not None and excludes.rx.match(s) is not None
+
+
+def walk_tree(root: Path, prune: ExcludeGlobs, *, pruned: bool = False) -> Iterator[tuple[Path, bool]]:
+    """(path, pruned) for every file under root, in rglob("*") order.
+
+    A directory matching prune, which holds only the exclude globs ending in "*" tested against
+    "<dir>/", is pruned: that trailing wildcard matches every path below it as well, so its files
+    come back with pruned=True and no further glob tests are made inside it.
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except PermissionError:
+        return
+    for e in entries:
+        try:
+            if e.is_dir(follow_symlinks=False):
+                subdirs.append(e.path)
+            elif e.is_file():
+                yield Path(e.path), pruned
+        except OSError:
+            continue
+    for d in subdirs:
+        yield from walk_tree(Path(d), prune, pruned=pruned or is_excluded(d + os.sep, prune))
 
 
 @dataclass
@@ -178,13 +266,48 @@ class ProbeResult:
     csv_sep: str = ""
 
 
+# rows pd.read_csv(nrows=...) parses after the header
+CSV_SAMPLE_ROWS = 25
+
+
+def read_csv_header(path: Path, *, encoding: str, sep: str) -> list[str] | None:
+    """Header fields of a plain CSV file, read with csv.reader instead of building a DataFrame.
+
+    None when the file needs pandas: it fails to decode, has bare-\\r line ends or quoting strict csv
+    rejects, one of the CSV_SAMPLE_ROWS rows after the header is ragged or holds a NUL, or the
+    header has fewer than two names or a blank, duplicate or BOM/NUL-carrying one.
+    pd.read_csv then gives the columns or the error.
+    """
+    try:
+        with open(path, encoding=encoding, newline="") as f:
+            rows = filter(None, csv.reader(f, delimiter=sep, strict=True))  # pandas skips blank lines
+            header = next(rows, None)
+            if header is None or len(header) < 2:
+                return None
+            for row in itertools.islice(rows, CSV_SAMPLE_ROWS):
+                if len(row) != len(header) or any("\x00" in v for v in row):
+                    return None
+            # pandas' C parser mishandles old-Mac bare-\r line ends
+            newlines = f.newlines if isinstance(f.newlines, tuple) else (f.newlines,)
+            if "\r" in newlines:
+                return None
+    except (UnicodeError, csv.Error):
+        return None
+    if len(set(header)) < len(header) or any(not h.strip() or "\ufeff" in h or "\x00" in h for h in header):
+        return None
+    return header
+
+
 def probe_csv(path: Path, header_terms: set[str], *, encodings: list[str], seps: list[str]) -> ProbeResult:
     last_err = ""
     for enc in encodings:
         for sep in seps:
             try:
-                df = pd.read_csv(path, dtype=str, nrows=25, low_memory=False, encoding=enc, sep=sep)
-                cols = [norm(c) for c in df.columns]
+                header = read_csv_header(path, encoding=enc, sep=sep)
+                if header is None:
+                    df = pd.read_csv(path, dtype=str, nrows=CSV_SAMPLE_ROWS, low_memory=False, encoding=enc, sep=sep)
+                    header = df.columns
+                cols = [norm(c) for c in header]
                 header_hit = any(any(t in c for c in cols) for t in header_terms)
                 return ProbeResult(
                     sheets_count=1,
@@ -203,9 +326,76 @@ def probe_csv(path: Path, header_terms: set[str], *, encodings: list[str], seps:
     return ProbeResult(0, "", "error", last_err, False, False, "", "")
 
 
+def _header_cell(v) -> str:
+    if isinstance(v, float) and v.is_integer():
+        v = int(v)
+    return str(v)
+
+
+def _trim_blank_tail(row: tuple) -> tuple:
+    """row without its trailing empty cells, which pandas drops too."""
+    n = len(row)
+    while n and row[n - 1].value in (None, ""):
+        n -= 1
+    return row[:n]
+
+
+def excel_header_rows(path: Path, max_sheets: int, max_rows: int) -> tuple[list[str], list[list[str]]] | None:
+    """(sheet names, header cells of the first max_sheets sheets) from an openpyxl read-only pass.
+
+    Reads the header and the max_rows rows pandas would parse. None when openpyxl can't read the
+    file, a header has a blank, error or duplicate cell, or the sheet is wider than its header:
+    pandas makes up names for those columns, so it probes the file.
+    """
+    if path.suffix.lower() not in {".xlsx", ".xlsm"}:
+        return None
+    import openpyxl
+
+    try:
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    except OPENPYXL_READ_ERRORS:
+        return None
+    try:
+        sheets = [ws.title for ws in wb.worksheets]
+        headers = []
+        for ws in wb.worksheets[:max_sheets]:
+            # a stale <dimension> (ref="A1") would cut the header short; pandas' reader ignores it too
+            ws.reset_dimensions()
+            rows = [_trim_blank_tail(r) for r in ws.iter_rows(max_row=1 + max_rows)]
+            row = rows[0] if rows else ()
+            if any(len(r) > len(row) for r in rows):
+                return None
+            values = [c.value for c in row]
+            if any(v is None or c.data_type == "e" or not str(v).strip() for c, v in zip(row, values)):
+                return None
+            names = [_header_cell(v) for v in values]
+            # pandas also suffixes equal values (1 and True) whose names differ
+            if len(set(values)) < len(values) or len(set(names)) < len(names):
+                return None
+            headers.append(names)
+        return sheets, headers
+    except OPENPYXL_READ_ERRORS:
+        return None
+    finally:
+        wb.close()
+
+
 def probe_excel(path: Path, header_terms: set[str], sheet_terms: set[str], max_sheets: int, max_rows: int) -> ProbeResult:
+    peek = excel_header_rows(path, max_sheets, max_rows)
+    if peek is not None:
+        sheets, headers = peek
+        header_hit = any(any(any(t in c for c in map(norm, h)) for t in header_terms) for h in headers)
+        return ProbeResult(
+            sheets_count=len(sheets),
+            sample_sheet_names=",".join(sheets[:10]),
+            parse_status="ok",
+            parse_exception="",
+            header_hit=header_hit,
+            sheetname_hit=any(any(st in norm(name) for st in sheet_terms) for name in sheets),
+        )
+
     try:
-        xl = pd.ExcelFile(path)
+        xl = pd.ExcelFile(path, engine=EXCEL_ENGINE)
         sheets = xl.sheet_names
         sample_names = ",".join(sheets[:10])
         sheetname_hit = any(any(st in norm(name) for st in sheet_terms) for name in sheets)
@@ -251,20 +441,112 @@ def probe_zip(path: Path) -> ProbeResult:
         return ProbeResult(0, "", "error", f"{type(e).__name__}: {e}", False, False)
 
 
-def safe_copy_to_quarantine(src: Path, quarantine_dir: Path) -> Path:
+def load_quarantine_index(path: Path) -> dict[str, str]:
+    """src -> dest of a previous run's quarantine index.csv ({} when missing or unreadable)."""
+    try:
+        with path.open(newline="", encoding="utf-8") as f:
+            return {r["src"]: r["dest"] for r in csv.DictReader(f) if r.get("src") and r.get("dest")}
+    except (OSError, KeyError, csv.Error, UnicodeDecodeError):
+        return {}
+
+
+def safe_copy_to_quarantine(src: Path, quarantine_dir: Path, known: dict[str, str] | None = None) -> Path:
+    # reuse the copy a previous run recorded for this source (whatever its naming scheme)
+    prev = known.get(str(src)) if known else None
+    if prev and Path(prev).exists():
+        return Path(prev)
     quarantine_dir.mkdir(parents=True, exist_ok=True)
     # avoid collisions by hashing full path
-    h = hashlib.sha1(str(src).encode("utf-8")).hexdigest()[:12]
+    h = hashlib.blake2b(str(src).encode("utf-8"), digest_size=6).hexdigest()
     dest = quarantine_dir / f"{src.stem}__{h}{src.suffix}"
     if not dest.exists():
-        shutil.copy2(src, dest)
+        # hardlink when on the same filesystem; copy otherwise
+        try:
+            os.link(src, dest)
+        except OSError:
+            shutil.copy2(src, dest)
     return dest
 
 
+REPORT_FIELDS = [
+    "file_path",
+    "included",
+    "reason",
+    "provider_guess",
+    "sheets_count",
+    "sample_sheet_names",
+    "parse_status",
+    "exception",
+    "csv_encoding",
+    "csv_sep",
+]
+
+
+def report_row(p: Path, reason: str, pr: ProbeResult | None = None) -> dict:
+    return {
+        "file_path": str(p),
+        "included": "Y" if reason == "included" else "N",
+        "reason": reason,
+        "provider_guess": guess_provider(p),
+        "sheets_count": pr.sheets_count if pr else 0,
+        "sample_sheet_names": pr.sample_sheet_names if pr else "",
+        "parse_status": pr.parse_status if pr else "n/a",
+        "exception": pr.parse_exception if pr and reason == "parse_error" else "",
+        "csv_encoding": pr.csv_encoding if pr else "",
+        "csv_sep": pr.csv_sep if pr else "",
+    }
+
+
+def classify_file(
+    p: Path,
+    ext: str,
+    *,
+    header_terms: set[str],
+    sheet_terms: set[str],
+    max_sheets: int,
+    max_rows: int,
+    quarantine_dir: Path,
+    quarantined_before: dict[str, str] | None = None,
+) -> tuple[str, dict, dict | None]:
+    """Probe one included-extension file: (reason, report row, quarantine index entry or None)."""
+    if ext == "csv":
+        pr = probe_csv(p, header_terms, encodings=["utf-8", "utf-8-sig", "latin-1"], seps=[",", ";", "\t"])
+    elif ext == "tsv":
+        # treat TSV as CSV with tab sep
+        pr = probe_csv(p, header_terms, encodings=["utf-8", "utf-8-sig", "latin-1"], seps=["\t", ",", ";"])
+    elif ext in {"xls", "xlsx", "xlsm"}:
+        pr = probe_excel(p, header_terms, sheet_terms, max_sheets=max_sheets, max_rows=max_rows)
+    elif ext == "xlsb":
+        # pandas needs optional engine (pyxlsb). If missing, classify as requiring dependency.
+        try:
+            import pyxlsb  # noqa: F401
+            pr = probe_excel(p, header_terms, sheet_terms, max_sheets=max_sheets, max_rows=max_rows)
+        except Exception as e:
+            pr = ProbeResult(0, "", "error", f"xlsb_requires_dependency: {type(e).__name__}: {e}", False, False)
+    elif ext == "zip":
+        pr = probe_zip(p)
+    else:
+        pr = ProbeResult(0, "", "n/a", "", False, False)
+
+    if pr.parse_status != "ok":
+        dest = safe_copy_to_quarantine(p, quarantine_dir, quarantined_before)
+        quarantined = {"src": str(p), "dest": str(dest), "error": pr.parse_exception}
+        return "parse_error", report_row(p, "parse_error", pr), quarantined
+
+    # heuristics
+    heur_ok = pr.header_hit or pr.sheetname_hit
+    if not heur_ok:
+        return "fails_heuristics", report_row(p, "fails_heuristics", pr), None
+
+    return "included", report_row(p, "included", pr), None
+
+
 def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--config", default="config/fornecedores_inclusion_rules.yaml")
     ap.add_argument("--out-dir", default=str(Path.home() / "Desktop" / "TempClaw"))
+    ap.add_argument("--no-cache", action="store_true", help="re-parse config files instead of using ~/.cache/sharkclaw")
+    ap.add_argument("--jobs", type=int, default=0, help="files probed concurrently (0 = cpu count)")
     args = ap.parse_args()
 
     repo_root = Path(__file__).resolve().parent.parent
@@ -272,7 +554,13 @@ def main() -> None:
     if not cfg_path.is_absolute():
         cfg_path = (repo_root / cfg_path).resolve()
 
-    cfg = parse_simple_yaml(cfg_path)
+    load_config, load_globs = parse_simple_yaml, load_exclude_globs
+    if not args.no_cache:
+        # parsed config files, reused while each file's mtime/size are unchanged
+        load_config = partial(cached_call, parse_simple_yaml, cache_dir=open_cache(CONFIG_CACHE_DIR, "coverage_config"))
+        load_globs = partial(cached_call, load_exclude_globs, cache_dir=open_cache(CONFIG_CACHE_DIR, "coverage_excludes"))
+
+    cfg = load_config(cfg_path)
 
     out_dir = Path(args.out_dir).expanduser()
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -285,7 +573,9 @@ def main() -> None:
     if exclude_file and not exclude_path.is_absolute():
         exclude_path = (repo_root / exclude_path).resolve()
 
-    exclude_globs = load_exclude_globs(exclude_path) if exclude_file else []
+    exclude_globs = load_globs(exclude_path) if exclude_file else []
+    excludes = compile_exclude_globs(exclude_globs)
+    prune = compile_exclude_globs([g for g in exclude_globs if g.endswith("*")])
 
     mh = cfg.get("minimum_heuristics", {})
     header_terms = {norm(x) for x in mh.get("header_any_of", [])}
@@ -295,134 +585,56 @@ def main() -> None:
     max_sheets = int(str(sampling.get("max_sheets", "5")))
     max_rows = int(str(sampling.get("max_rows_per_sheet", "25")))
 
-    report_rows = []
     quarantine_dir = out_dir / "quarantine_parse_errors"
     quarantine_index = []
 
     reasons = Counter()
 
+    # walk order is report order; probe slots (None) are filled from the pool in the same order
+    slots: list[tuple[str, dict, dict | None] | None] = []
+    probe_paths: list[Path] = []
+    probe_exts: list[str] = []
     for root in include_roots:
         if not root.exists():
             continue
-        for p in root.rglob("*"):
-            if not p.is_file():
-                continue
+        for p, pruned in walk_tree(root, prune):
             ext = p.suffix.lower().lstrip(".")
 
             if ext not in include_ext:
-                reasons["unsupported_ext"] += 1
-                report_rows.append(
-                    {
-                        "file_path": str(p),
-                        "included": "N",
-                        "reason": "unsupported_ext",
-                        "provider_guess": guess_provider(p),
-                        "sheets_count": 0,
-                        "sample_sheet_names": "",
-                        "parse_status": "n/a",
-                        "exception": "",
-                        "csv_encoding": "",
-                        "csv_sep": "",
-                    }
-                )
+                slots.append(("unsupported_ext", report_row(p, "unsupported_ext"), None))
                 continue
 
-            if is_excluded(p, exclude_globs):
-                reasons["excluded_by_glob"] += 1
-                report_rows.append(
-                    {
-                        "file_path": str(p),
-                        "included": "N",
-                        "reason": "excluded_by_glob",
-                        "provider_guess": guess_provider(p),
-                        "sheets_count": 0,
-                        "sample_sheet_names": "",
-                        "parse_status": "n/a",
-                        "exception": "",
-                        "csv_encoding": "",
-                        "csv_sep": "",
-                    }
-                )
+            if pruned or is_excluded(p, excludes):
+                slots.append(("excluded_by_glob", report_row(p, "excluded_by_glob"), None))
                 continue
 
-            # probe
-            if ext == "csv":
-                pr = probe_csv(p, header_terms, encodings=["utf-8", "utf-8-sig", "latin-1"], seps=[",", ";", "\t"])
-            elif ext == "tsv":
-                # treat TSV as CSV with tab sep
-                pr = probe_csv(p, header_terms, encodings=["utf-8", "utf-8-sig", "latin-1"], seps=["\t", ",", ";"])
-            elif ext in {"xls", "xlsx", "xlsm"}:
-                pr = probe_excel(p, header_terms, sheet_terms, max_sheets=max_sheets, max_rows=max_rows)
-            elif ext == "xlsb":
-                # pandas needs optional engine (pyxlsb). If missing, classify as requiring dependency.
-                try:
-                    import pyxlsb  # noqa: F401
-                    pr = probe_excel(p, header_terms, sheet_terms, max_sheets=max_sheets, max_rows=max_rows)
-                except Exception as e:
-                    pr = ProbeResult(0, "", "error", f"xlsb_requires_dependency: {type(e).__name__}: {e}", False, False)
-            elif ext == "zip":
-                pr = probe_zip(p)
-            else:
-                pr = ProbeResult(0, "", "n/a", "", False, False)
-
-            if pr.parse_status != "ok":
-                reasons["parse_error"] += 1
-                dest = safe_copy_to_quarantine(p, quarantine_dir)
-                quarantine_index.append({"src": str(p), "dest": str(dest), "error": pr.parse_exception})
-                report_rows.append(
-                    {
-                        "file_path": str(p),
-                        "included": "N",
-                        "reason": "parse_error",
-                        "provider_guess": guess_provider(p),
-                        "sheets_count": pr.sheets_count,
-                        "sample_sheet_names": pr.sample_sheet_names,
-                        "parse_status": pr.parse_status,
-                        "exception": pr.parse_exception,
-                        "csv_encoding": pr.csv_encoding,
-                        "csv_sep": pr.csv_sep,
-                    }
-                )
-                continue
-
-            # heuristics
-            heur_ok = pr.header_hit or pr.sheetname_hit
-            if not heur_ok:
-                reasons["fails_heuristics"] += 1
-                report_rows.append(
-                    {
-                        "file_path": str(p),
-                        "included": "N",
-                        "reason": "fails_heuristics",
-                        "provider_guess": guess_provider(p),
-                        "sheets_count": pr.sheets_count,
-                        "sample_sheet_names": pr.sample_sheet_names,
-                        "parse_status": pr.parse_status,
-                        "exception": "",
-                        "csv_encoding": pr.csv_encoding,
-                        "csv_sep": pr.csv_sep,
-                    }
-                )
-                continue
-
-            reasons["included"] += 1
-            report_rows.append(
-                {
-                    "file_path": str(p),
-                    "included": "Y",
-                    "reason": "included",
-                    "provider_guess": guess_provider(p),
-                    "sheets_count": pr.sheets_count,
-                    "sample_sheet_names": pr.sample_sheet_names,
-                    "parse_status": pr.parse_status,
-                    "exception": "",
-                    "csv_encoding": pr.csv_encoding,
-                    "csv_sep": pr.csv_sep,
-                }
-            )
-
+            slots.append(None)
+            probe_paths.append(p)
+            probe_exts.append(ext)
+
+    classify = partial(
+        classify_file,
+        header_terms=header_terms,
+        sheet_terms=sheet_terms,
+        max_sheets=max_sheets,
+        max_rows=max_rows,
+        quarantine_dir=quarantine_dir,
+        quarantined_before=load_quarantine_index(quarantine_dir / "index.csv"),
+    )
+    # rows are written as they come back from the pool instead of being collected for pandas
     report_path = out_dir / "coverage_report.csv"
-    pd.DataFrame(report_rows).to_csv(report_path, index=False)
+    with report_path.open("w", newline="", encoding="utf-8") as f, ThreadPoolExecutor(
+        max_workers=args.jobs or os.cpu_count() or 1
+    ) as pool:
+        w = csv.DictWriter(f, fieldnames=REPORT_FIELDS, lineterminator="\n")
+        w.writeheader()
+        probed = pool.map(classify, probe_paths, probe_exts)
+        for slot in slots:
+            reason, row, quarantined = slot if slot is not None else next(probed)
+            reasons[reason] += 1
+            w.writerow(row)
+            if quarantined is not None:
+                quarantine_index.append(quarantined)
 
     summary_path = out_dir / "coverage_summary.txt"
     lines = []
@@ -443,7 +655,7 @@ def main() -> None:
     else:
         quarantine_index_path.write_text("src,dest,error\n", encoding="utf-8")
 
-    print(f"Wrote: {report_path} rows={len(report_rows)}")
+    print(f"Wrote: {report_path} rows={len(slots)}")
     print(f"Wrote: {summary_path}")
     print(f"Wrote: {quarantine_index_path} rows={len(quarantine_index)}")
 
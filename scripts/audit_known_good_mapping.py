@@ -10,36 +10,83 @@ Outputs:
 - known_good_mapping_audit_summary.txt
 - known_good_top_entity_hits.csv (entity detection using detected columns)
 
+Per-template results are cached in .cache next to the audit CSV and reused while the
+workbook's mtime/size (and the synonyms/settings) are unchanged, unless --no-cache.
+
 This is audit-only.
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
+import sys
 from collections import Counter, defaultdict
+from collections.abc import Callable
+from functools import lru_cache, partial
 from pathlib import Path
 
 import pandas as pd
 
 from scripts.field_detection import load_synonyms_yaml, norm_header, resolve_fields
+from scripts.file_cache import cached_call, open_cache
+
+# optional Rust Excel reader; pandas picks openpyxl/xlrd/pyxlsb when unavailable
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+
+AUDIT_FIELDS = [
+    "provider_guess",
+    "file_path",
+    "sheet",
+    "has_title",
+    "has_artist",
+    "has_author",
+    "detected_title_cols",
+    "detected_artist_cols",
+    "detected_author_cols",
+    "header_mode_used",
+    "detected_header_row_index",
+    "detected_header_quality_score",
+    "raw_headers_used",
+    "normalized_headers_used",
+    "notes",
+]
+
+ENTITY_FIELDS = ["entity_norm", "hit_count", "files_hit_count", "hit_field_breakdown", "top_files"]
+
+COMMON_HEADER_TOKENS = frozenset(
+    {"obra", "musica", "titulo", "repertorio", "isrc", "autor", "autores", "compositor", "interprete", "artista", "programa", "data", "canal"}
+)
 
 
-def header_quality_score(headers: list[str], syn: dict[str, list[str]]) -> int:
+@lru_cache(maxsize=1 << 17)
+def norm_header_cached(s: str) -> str:
+    """norm_header, memoized and interned: header cells repeat across rows, sheets and templates."""
+    return sys.intern(norm_header(s))
+
+
+def flatten_synonyms(syn: dict[str, list[str]]) -> frozenset[str]:
+    """Every synonym of every field, normalized: computed once per run for header_quality_score."""
+    return frozenset(norm_header_cached(s) for v in syn.values() for s in v)
+
+
+def header_quality_score(headers: list[str], syn_flat: frozenset[str]) -> int:
     """Score a header row; higher is better.
 
     Heuristics:
     - Penalize Unnamed / numeric-like headers
-    - Reward presence of synonym matches or common playlog tokens
+    - Reward presence of synonym matches (syn_flat = flatten_synonyms(syn)) or common playlog tokens
     """
 
-    syn_flat = set()
-    for v in syn.values():
-        for s in v:
-            syn_flat.add(norm_header(s))
-
     score = 0
     for h in headers:
-        hn = norm_header(h)
+        hn = norm_header_cached(h)
         if not hn:
             continue
         if hn.startswith("unnamed"):
@@ -53,37 +100,60 @@ def header_quality_score(headers: list[str], syn: dict[str, list[str]]) -> int:
             score += 6
         # reward common header tokens
         toks = set(hn.split())
-        if toks & {"obra", "musica", "titulo", "repertorio", "isrc", "autor", "autores", "compositor", "interprete", "artista", "programa", "data", "canal"}:
+        if toks & COMMON_HEADER_TOKENS:
             score += 3
 
     return score
 
 
-def should_detect_header_row(headers: list[str], *, has_title: bool, has_people: bool) -> bool:
+def _uniq_keep_order(xs) -> list:
+    seen: set = set()
+    add = seen.add
+    return [x for x in xs if not (x in seen or add(x))]
+
+
+def column_entity_hits(entities: list, values: list) -> set[str]:
+    """entity_norms of the entities matching at least one non-blank value; each distinct value is tokenized once."""
+
+    from scripts.audit_top_entities_frequency import first_entity_matches
+
+    return set(first_entity_matches(entities, values))
+
+
+def should_detect_header_row(normalized_headers: list[str], *, has_title: bool, has_people: bool) -> bool:
+    """normalized_headers: the row's headers through norm_header (computed once by the caller)."""
     if not (has_title and has_people):
         return True
-    if not headers:
+    if not normalized_headers:
         return True
-    unnamed = sum(1 for h in headers if norm_header(h).startswith("unnamed"))
-    if unnamed / max(1, len(headers)) >= 0.6:
+    unnamed = sum(1 for h in normalized_headers if h.startswith("unnamed"))
+    if unnamed / max(1, len(normalized_headers)) >= 0.6:
         return True
     return False
 
 
-def detect_best_header_row(xl: pd.ExcelFile, sheet: str, syn: dict[str, list[str]], *, scan_rows: int = 120) -> tuple[int | None, int]:
-    """Scan first scan_rows with header=None and pick the best row to use as header."""
+def detect_best_header_row(
+    parse: Callable[..., pd.DataFrame],
+    syn_flat: frozenset[str],
+    *,
+    scan_rows: int = 120,
+) -> tuple[int | None, int]:
+    """Scan first scan_rows with header=None and pick the best row to use as header.
+
+    parse(header=..., nrows=...) reads the sheet with dtype=str (a partial of xl.parse).
+    """
 
     try:
-        df0 = xl.parse(sheet, header=None, dtype=str, nrows=scan_rows).fillna("")
+        df0 = parse(header=None, nrows=scan_rows).fillna("")
     except Exception:
         return None, 0
+    cells = ([str(x) for x in r] for r in df0.itertuples(index=False, name=None))
 
     best_idx: int | None = None
     best_score = 0
 
-    for i in range(len(df0)):
-        row = [str(x) for x in df0.iloc[i].tolist()]
-        sc = header_quality_score(row, syn)
+    for i, row in enumerate(cells):
+        sc = header_quality_score(row, syn_flat)
         if sc > best_score:
             best_score = sc
             best_idx = int(i)
@@ -91,6 +161,142 @@ def detect_best_header_row(xl: pd.ExcelFile, sheet: str, syn: dict[str, list[str
     return best_idx, int(best_score)
 
 
+def audit_template(
+    prov: str,
+    fp: Path,
+    sh: str,
+    *,
+    syn: dict[str, list[str]],
+    syn_flat: frozenset[str],
+    entities: list,
+    max_rows: int,
+    header_scan_rows: int,
+) -> tuple[dict, list[tuple[str, str]], bool]:
+    """Audit one template sheet: (audit row, (entity_norm, column) hits, listed as failing)."""
+
+    header_mode_used = "default0"
+    detected_header_row_index: int | None = None
+    detected_header_quality_score = ""
+    raw_headers_used: list[str] = []
+    normalized_headers_used: list[str] = []
+
+    try:
+        xl = pd.ExcelFile(fp, engine=EXCEL_ENGINE)
+        parse = partial(xl.parse, sh, dtype=str)
+        # first try default header=0
+        df = parse(header=0, nrows=max_rows).fillna("")
+    except Exception as e:
+        row = {
+            "provider_guess": prov,
+            "file_path": str(fp),
+            "sheet": sh,
+            "has_title": 0,
+            "has_artist": 0,
+            "has_author": 0,
+            "detected_title_cols": "",
+            "detected_artist_cols": "",
+            "detected_author_cols": "",
+            "header_mode_used": header_mode_used,
+            "detected_header_row_index": "",
+            "detected_header_quality_score": "",
+            "raw_headers_used": "",
+            "normalized_headers_used": "",
+            "notes": f"parse_error:{type(e).__name__}",
+        }
+        return row, [], False
+
+    headers0 = [str(c) for c in df.columns]
+    normalized0 = [norm_header_cached(h) for h in headers0]
+    res0 = resolve_fields(headers0, syn)
+
+    title_cols0 = [c.column for c in res0.get("title", [])[:3]]
+    artist_cols0 = [c.column for c in res0.get("artist", [])[:3]]
+    author_cols0 = [c.column for c in res0.get("author", [])[:3]]
+    has_title0 = 1 if title_cols0 else 0
+    has_people0 = 1 if (artist_cols0 or author_cols0) else 0
+
+    # If default headers look wrong or mapping fails, detect better header row
+    if should_detect_header_row(normalized0, has_title=bool(has_title0), has_people=bool(has_people0)):
+        best_idx, best_sc = detect_best_header_row(parse, syn_flat, scan_rows=header_scan_rows)
+        if best_idx is not None and best_sc > header_quality_score(headers0, syn_flat):
+            try:
+                df2 = parse(header=best_idx, nrows=max_rows).fillna("")
+                df = df2
+                headers = [str(c) for c in df2.columns]
+                res = resolve_fields(headers, syn)
+                header_mode_used = "detected_row"
+                detected_header_row_index = int(best_idx)
+                detected_header_quality_score = str(int(best_sc))
+                raw_headers_used = headers
+                normalized_headers_used = [norm_header_cached(h) for h in headers]
+            except Exception:
+                headers = headers0
+                res = res0
+                raw_headers_used = headers0
+                normalized_headers_used = normalized0
+        else:
+            headers = headers0
+            res = res0
+            raw_headers_used = headers0
+            normalized_headers_used = normalized0
+    else:
+        headers = headers0
+        res = res0
+        raw_headers_used = headers0
+        normalized_headers_used = normalized0
+
+    title_cols = [c.column for c in res.get("title", [])[:3]]
+    artist_cols = [c.column for c in res.get("artist", [])[:3]]
+    author_cols = [c.column for c in res.get("author", [])[:3]]
+
+    has_title = 1 if title_cols else 0
+    has_artist = 1 if artist_cols else 0
+    has_author = 1 if author_cols else 0
+
+    notes = ""
+    if not has_title:
+        notes = "missing_title_detect"
+    if not (has_artist or has_author):
+        notes = (notes + ";" if notes else "") + "missing_artist_author_detect"
+
+    row = {
+        "provider_guess": prov,
+        "file_path": str(fp),
+        "sheet": sh,
+        "has_title": has_title,
+        "has_artist": has_artist,
+        "has_author": has_author,
+        "detected_title_cols": "|".join(title_cols),
+        "detected_artist_cols": "|".join(artist_cols),
+        "detected_author_cols": "|".join(author_cols),
+        "header_mode_used": header_mode_used,
+        "detected_header_row_index": str(detected_header_row_index) if detected_header_row_index is not None else "",
+        "detected_header_quality_score": detected_header_quality_score,
+        "raw_headers_used": "|".join(raw_headers_used[:60]),
+        "normalized_headers_used": "|".join(normalized_headers_used[:60]),
+        "notes": notes,
+    }
+
+    # entity scan using detected cols only
+    scan_cols = _uniq_keep_order((*artist_cols, *author_cols)) if (artist_cols or author_cols) else []
+    hits: list[tuple[str, str]] = []
+    if scan_cols:
+        col_hits = {}
+        for c in scan_cols:
+            try:
+                ser = df[c].astype(str)
+            except Exception:
+                continue
+            col_hits[c] = column_entity_hits(entities, ser.tolist())
+        # one hit per (entity, column), counted in the original entity-then-column order
+        for ent in entities:
+            for c, hit in col_hits.items():
+                if ent.entity_norm in hit:
+                    hits.append((ent.entity_norm, c))
+
+    return row, hits, bool(notes)
+
+
 def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--templates", required=True)
@@ -100,165 +306,69 @@ def main() -> None:
     ap.add_argument("--out-entity", required=True)
     ap.add_argument("--max-rows", type=int, default=20000)
     ap.add_argument("--header-scan-rows", type=int, default=120)
+    ap.add_argument("--no-cache", action="store_true", help="re-audit every template, ignoring the .cache next to --out-csv")
     args = ap.parse_args()
 
     tmpl = pd.read_csv(args.templates, dtype=str, low_memory=False).fillna("")
     syn = load_synonyms_yaml(Path(args.synonyms))
+    syn_flat = flatten_synonyms(syn)
 
-    audit_rows = []
     fails = []
 
     # entity hits (very small: use top entities list)
-    from scripts.audit_top_entities_frequency import default_entities, entity_match_in_text
+    from scripts.audit_top_entities_frequency import default_entities
 
     entities = default_entities()
     ent_hits = Counter()
     ent_files = defaultdict(set)
     ent_fields = defaultdict(Counter)
 
-    for _, r in tmpl.iterrows():
-        prov = r.get("provider_guess", "")
-        fp = Path(r.get("file_path", ""))
-        sh = r.get("sheet_name", "")
-        if not fp.exists():
-            continue
-
-        header_mode_used = "default0"
-        detected_header_row_index: int | None = None
-        detected_header_quality_score = ""
-        raw_headers_used: list[str] = []
-        normalized_headers_used: list[str] = []
-
-        try:
-            xl = pd.ExcelFile(fp)
-            # first try default header=0
-            df = xl.parse(sh, dtype=str, nrows=args.max_rows).fillna("")
-        except Exception as e:
-            audit_rows.append(
-                {
-                    "provider_guess": prov,
-                    "file_path": str(fp),
-                    "sheet": sh,
-                    "has_title": 0,
-                    "has_artist": 0,
-                    "has_author": 0,
-                    "detected_title_cols": "",
-                    "detected_artist_cols": "",
-                    "detected_author_cols": "",
-                    "header_mode_used": header_mode_used,
-                    "detected_header_row_index": "",
-                    "detected_header_quality_score": "",
-                    "raw_headers_used": "",
-                    "normalized_headers_used": "",
-                    "notes": f"parse_error:{type(e).__name__}",
-                }
-            )
-            continue
-
-        headers0 = [str(c) for c in df.columns]
-        res0 = resolve_fields(headers0, syn)
-
-        title_cols0 = [c.column for c in res0.get("title", [])[:3]]
-        artist_cols0 = [c.column for c in res0.get("artist", [])[:3]]
-        author_cols0 = [c.column for c in res0.get("author", [])[:3]]
-        has_title0 = 1 if title_cols0 else 0
-        has_people0 = 1 if (artist_cols0 or author_cols0) else 0
-
-        # If default headers look wrong or mapping fails, detect better header row
-        if should_detect_header_row(headers0, has_title=bool(has_title0), has_people=bool(has_people0)):
-            best_idx, best_sc = detect_best_header_row(xl, sh, syn, scan_rows=args.header_scan_rows)
-            if best_idx is not None and best_sc > header_quality_score(headers0, syn):
-                try:
-                    df2 = xl.parse(sh, dtype=str, header=best_idx, nrows=args.max_rows).fillna("")
-                    df = df2
-                    headers = [str(c) for c in df2.columns]
-                    res = resolve_fields(headers, syn)
-                    header_mode_used = "detected_row"
-                    detected_header_row_index = int(best_idx)
-                    detected_header_quality_score = str(int(best_sc))
-                    raw_headers_used = headers
-                    normalized_headers_used = [norm_header(h) for h in headers]
-                except Exception:
-                    headers = headers0
-                    res = res0
-                    raw_headers_used = headers0
-                    normalized_headers_used = [norm_header(h) for h in headers0]
-            else:
-                headers = headers0
-                res = res0
-                raw_headers_used = headers0
-                normalized_headers_used = [norm_header(h) for h in headers0]
-        else:
-            headers = headers0
-            res = res0
-            raw_headers_used = headers0
-            normalized_headers_used = [norm_header(h) for h in headers0]
-
-        title_cols = [c.column for c in res.get("title", [])[:3]]
-        artist_cols = [c.column for c in res.get("artist", [])[:3]]
-        author_cols = [c.column for c in res.get("author", [])[:3]]
-
-        has_title = 1 if title_cols else 0
-        has_artist = 1 if artist_cols else 0
-        has_author = 1 if author_cols else 0
-
-        notes = ""
-        if not has_title:
-            notes = "missing_title_detect"
-        if not (has_artist or has_author):
-            notes = (notes + ";" if notes else "") + "missing_artist_author_detect"
-
-        audit_rows.append(
-            {
-                "provider_guess": prov,
-                "file_path": str(fp),
-                "sheet": sh,
-                "has_title": has_title,
-                "has_artist": has_artist,
-                "has_author": has_author,
-                "detected_title_cols": "|".join(title_cols),
-                "detected_artist_cols": "|".join(artist_cols),
-                "detected_author_cols": "|".join(author_cols),
-                "header_mode_used": header_mode_used,
-                "detected_header_row_index": str(detected_header_row_index) if detected_header_row_index is not None else "",
-                "detected_header_quality_score": detected_header_quality_score,
-                "raw_headers_used": "|".join(raw_headers_used[:60]),
-                "normalized_headers_used": "|".join(normalized_headers_used[:60]),
-                "notes": notes,
-            }
-        )
-
-        if notes:
-            fails.append((prov, fp.name, sh, notes))
-
-        # entity scan using detected cols only
-        scan_cols = list(dict.fromkeys((artist_cols + author_cols)))
-        if scan_cols:
-            for ent in entities:
-                hit_cols = []
-                for c in scan_cols:
-                    try:
-                        ser = df[c].astype(str)
-                    except Exception:
-                        continue
-                    for v in ser.tolist():
-                        if not str(v).strip():
-                            continue
-                        if entity_match_in_text(ent, v):
-                            ent_hits[ent.entity_norm] += 1
-                            ent_files[ent.entity_norm].add(str(fp))
-                            ent_fields[ent.entity_norm][c] += 1
-                            hit_cols.append(c)
-                            break
-
     out_csv = Path(args.out_csv).expanduser()
     out_csv.parent.mkdir(parents=True, exist_ok=True)
-    pd.DataFrame(audit_rows).to_csv(out_csv, index=False)
+
+    audit = partial(
+        audit_template,
+        syn=syn,
+        syn_flat=syn_flat,
+        entities=entities,
+        max_rows=args.max_rows,
+        header_scan_rows=args.header_scan_rows,
+    )
+    if not args.no_cache:
+        # per-template results keyed by workbook (mtime, size) and everything else that shapes them
+        cache_dir = open_cache(
+            out_csv.parent / ".cache",
+            "audit_known_good_mapping",
+            sorted(syn.items()),
+            {"max_rows": args.max_rows, "header_scan_rows": args.header_scan_rows},
+        )
+        audit = partial(cached_call, audit, cache_dir=cache_dir, src=1)
+
+    total = 0
+    good = 0
+    # audit rows are written as they are produced; the summary only needs the running counts
+    with out_csv.open("w", newline="", encoding="utf-8") as audit_f:
+        audit_w = csv.DictWriter(audit_f, fieldnames=AUDIT_FIELDS, lineterminator="\n")
+        audit_w.writeheader()
+        for _, r in tmpl.iterrows():
+            prov = r.get("provider_guess", "")
+            fp = Path(r.get("file_path", ""))
+            sh = r.get("sheet_name", "")
+            if not fp.exists():
+                continue
+
+            row, hits, failed = audit(prov, fp, sh)
+            total += 1
+            good += 1 if row["has_title"] and (row["has_artist"] or row["has_author"]) else 0
+            audit_w.writerow(row)
+            if failed:
+                fails.append((prov, fp.name, sh, row["notes"]))
+            for en, c in hits:
+                ent_hits[en] += 1
+                ent_files[en].add(str(fp))
+                ent_fields[en][c] += 1
 
     # summary
-    df_a = pd.DataFrame(audit_rows)
-    total = len(df_a)
-    good = int(((df_a["has_title"] == 1) & ((df_a["has_artist"] == 1) | (df_a["has_author"] == 1))).sum())
     pct = (good / total) if total else 0
 
     lines = []
@@ -274,21 +384,21 @@ def main() -> None:
     out_sum.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
     # entity hits output
-    ent_rows = []
-    for ent, cnt in ent_hits.most_common():
-        files = sorted(ent_files.get(ent, set()))
-        ent_rows.append(
-            {
-                "entity_norm": ent,
-                "hit_count": int(cnt),
-                "files_hit_count": len(files),
-                "hit_field_breakdown": ",".join(f"{k}:{v}" for k, v in ent_fields[ent].most_common(10)),
-                "top_files": ";".join([Path(f).name for f in files[:10]]),
-            }
-        )
-
     out_ent = Path(args.out_entity).expanduser()
-    pd.DataFrame(ent_rows).to_csv(out_ent, index=False)
+    with out_ent.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=ENTITY_FIELDS, lineterminator="\n")
+        w.writeheader()
+        for ent, cnt in ent_hits.most_common():
+            files = sorted(ent_files.get(ent, set()))
+            w.writerow(
+                {
+                    "entity_norm": ent,
+                    "hit_count": int(cnt),
+                    "files_hit_count": len(files),
+                    "hit_field_breakdown": ",".join(f"{k}:{v}" for k, v in ent_fields[ent].most_common(10)),
+                    "top_files": ";".join([Path(f).name for f in files[:10]]),
+                }
+            )
 
     print(f"Wrote: {out_csv}")
     print(f"Wrote: {out_sum}")
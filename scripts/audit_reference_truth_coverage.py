@@ -20,7 +20,9 @@ import pandas as pd
 
 
 def nonempty(series: pd.Series) -> int:
-    return int(series.astype(str).str.strip().replace({"nan": ""}).ne("").sum())
+    """Cells that are not blank once stripped; a literal "nan" counts as blank."""
+    s = series.astype(str).str.strip()
+    return int((s.ne("") & s.ne("nan")).sum())
 
 
 def main() -> None:
@@ -12,14 +12,18 @@ Strategy (deep-but-cheap)
 - Filter coverage to included=Y and structured only (.xls/.xlsx/.csv/.tsv; .xlsb only if supported).
 - For XLS/XLSX/XLSB:
   - list sheet names
-  - for each sheet, read headers to detect candidate columns
+  - for each sheet, read its first rows once, then take headers from them to detect candidate columns
   - if candidate columns exist: scan ONLY those columns for up to N rows (default 20,000)
     (stop early per entity if desired via --hits-cap-per-entity)
   - if candidate columns do NOT exist: fallback to scanning title/obra columns only for long titles (len>=12)
     (does not attempt to find entities; records stop_reason)
 - For CSV/TSV:
-  - encoding/sep fallbacks
+  - encoding/sep fallbacks (with pyarrow, only the header and the candidate columns are parsed)
   - scan only candidate columns if present; else skip
+- Files are scanned in parallel (--workers; serially below 64 files); hit caps are applied afterwards, in coverage order.
+  Per-file scans are cached in out-dir/.cache and reused while the file's mtime/size (and the
+  entities/settings) are unchanged, unless --no-cache.
+  Once every entity is capped, the remaining files are skipped (stop_reason=cap_reached).
 
 Matching
 - Token-boundary (all entity tokens present), accent-insensitive.
@@ -39,35 +43,63 @@ from __future__ import annotations
 
 import argparse
 import re
+import sys
 import unicodedata
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 
 import pandas as pd
 
+# scripts/ is not a Python package; add it to sys.path for local imports
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from csv_io import (  # noqa: E402
+    ARROW_CSV_ERRORS,
+    arrow_string_options,
+    pa,
+    pacsv,
+    read_plain_header,
+    write_rows_csv,
+)
+from file_cache import cached_call, open_cache  # noqa: E402
+from workers import SERIAL_BELOW_FILES, pool_workers  # noqa: E402
 
 # --- Normalization helpers (aligned with entity_overrides.py) ---
 _NON_ALNUM = re.compile(r"[^0-9a-z]+")
-_WS = re.compile(r"\s+")
+
+
+class _CombiningMarks(dict):
+    """str.translate table deleting combining marks; each code point is classified once, on first use."""
+
+    def __missing__(self, cp: int) -> int | None:
+        self[cp] = None if unicodedata.combining(chr(cp)) else cp
+        return self[cp]
+
+
+_STRIP_COMBINING = _CombiningMarks()
 
 
 def strip_accents(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s)
-    return "".join(ch for ch in s if not unicodedata.combining(ch))
+    # ASCII is its own NFKD form: most catalog cells skip the Unicode database entirely
+    if s.isascii():
+        return s
+    return unicodedata.normalize("NFKD", s).translate(_STRIP_COMBINING)
 
 
 def norm_text(s: str) -> str:
     s = "" if s is None else str(s)
     s = strip_accents(s.casefold())
-    s = _NON_ALNUM.sub(" ", s)
-    s = _WS.sub(" ", s).strip()
-    return s
+    # each non-alnum run (whitespace included) becomes one space, so no separate whitespace collapse
+    return _NON_ALNUM.sub(" ", s).strip()
 
 
-def tokenize_norm(s: str) -> list[str]:
-    s = norm_text(s)
-    return [t for t in s.split(" ") if t]
+# cells repeat heavily across columns, sheets and files; typed keeps 1, 1.0 and True apart
+@lru_cache(maxsize=1 << 17, typed=True)
+def tokenize_norm(s: str) -> tuple[str, ...]:
+    return tuple(norm_text(s).split())
 
 
 def joined_norm(s: str) -> str:
@@ -78,14 +110,18 @@ def joined_norm(s: str) -> str:
 class Entity:
     entity_norm: str
     priority: int
+    # derived once at construction; matching runs per scanned value
+    tokens: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    token_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    joined: str = field(init=False, repr=False, compare=False)
+    needs_joined: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def tokens(self) -> tuple[str, ...]:
-        return tuple(tokenize_norm(self.entity_norm))
-
-    @property
-    def joined(self) -> str:
-        return "".join(self.tokens)
+    def __post_init__(self) -> None:
+        toks = tokenize_norm(self.entity_norm)
+        object.__setattr__(self, "tokens", toks)
+        object.__setattr__(self, "token_set", frozenset(toks))
+        object.__setattr__(self, "joined", "".join(toks))
+        object.__setattr__(self, "needs_joined", self.priority >= 4 and bool(toks))
 
 
 def default_entities() -> list[Entity]:
@@ -122,59 +158,186 @@ def default_entities() -> list[Entity]:
 
 
 def entity_match_in_text(ent: Entity, text: str) -> bool:
-    toks = ent.tokens
-    if not toks:
+    toks = tokenize_norm(text)
+    return entity_match_tokens(ent, set(toks), "".join(toks))
+
+
+def entity_match_tokens(ent: Entity, tset: set[str], jt: str) -> bool:
+    """entity_match_in_text on a pre-tokenized text (tset = its tokens, jt = joined_norm(text))."""
+
+    if not ent.token_set:
         return False
 
-    tset = set(tokenize_norm(text))
-    if all(t in tset for t in toks):
+    if ent.token_set <= tset:
         return True
 
-    if ent.priority >= 4:
-        jt = joined_norm(text)
-        if ent.joined and ent.joined in jt:
-            return True
+    return ent.needs_joined and ent.joined in jt
+
+
+@dataclass(frozen=True)
+class EntityIndex:
+    """Entities compiled for a single lookup per value (see match_all)."""
 
-    return False
+    by_token: dict[str, tuple[Entity, ...]]  # first entity token -> entities
+    joined_rx: re.Pattern[str] | None
+    by_joined: dict[str, tuple[Entity, ...]]
 
 
+def build_entity_index(entities: list[Entity]) -> EntityIndex:
+    by_token = defaultdict(list)
+    joined_ents = defaultdict(list)
+    for ent in entities:
+        if not ent.tokens:
+            continue
+        # every token must be present, so one bucket per entity is enough
+        by_token[ent.tokens[0]].append(ent)
+        if ent.needs_joined:
+            joined_ents[ent.joined].append(ent)
+
+    # One overlapping, longest-first alternation over all joined forms. At each
+    # position it reports the longest form present; every shorter form starting
+    # there is a prefix of it, so by_joined maps a form to all prefix-forms' entities.
+    forms = sorted(joined_ents, key=len, reverse=True)
+    joined_rx = None
+    by_joined = {}
+    if forms:
+        joined_rx = re.compile("(?=(" + "|".join(re.escape(f) for f in forms) + "))")
+        for f in forms:
+            by_joined[f] = tuple(e for g in forms if f.startswith(g) for e in joined_ents[g])
+
+    return EntityIndex(
+        by_token={t: tuple(v) for t, v in by_token.items()},
+        joined_rx=joined_rx,
+        by_joined=by_joined,
+    )
+
+
+def match_all(index: EntityIndex, tset: set[str], jt: str) -> set[Entity]:
+    """Every indexed entity that entity_match_tokens() would accept for this pre-tokenized text."""
+
+    out = set()
+    for tok in tset:
+        for ent in index.by_token.get(tok, ()):
+            if ent.token_set <= tset:
+                out.add(ent)
+    if index.joined_rx is not None:
+        for m in index.joined_rx.finditer(jt):
+            out.update(index.by_joined[m.group(1)])
+    return out
+
+
+def first_entity_matches(entities: list[Entity], values: list) -> dict[str, str]:
+    """entity_norm -> first non-blank value matching it; each distinct value is looked up once for all entities."""
+
+    index = build_entity_index(entities)
+    pending = {e.entity_norm for e in entities if e.tokens}
+    # normalization never lengthens ASCII, so an ASCII cell shorter than every entity's tokens cannot match
+    min_len = min((sum(map(len, e.token_set)) for e in entities if e.tokens), default=0)
+    found: dict[str, str] = {}
+    for v in dict.fromkeys(values):
+        if not pending:
+            break
+        s = str(v)
+        if (len(s) < min_len and s.isascii()) or not s.strip():
+            continue
+        toks = tokenize_norm(v)
+        for ent in match_all(index, set(toks), "".join(toks)):
+            if ent.entity_norm in pending:
+                pending.discard(ent.entity_norm)
+                found[ent.entity_norm] = v
+    return found
+
+
+# matched against casefolded, accent-stripped column names, so the alternatives stay plain ASCII
 LIKELY_COL_RX = re.compile(
-    r"artista|autor|compositor|interprete|int[ée]rprete|titular|particip|editora|publisher|owner|direito|obra|t[íi]tulo|title|nome_",
-    re.IGNORECASE,
+    r"artista|autor|compositor|interprete|titular|particip|editora|publisher|owner|direito|obra|titulo|title|nome_"
 )
 
-TITLE_COL_RX = re.compile(r"obra|t[íi]tulo|title", re.IGNORECASE)
+TITLE_COL_RX = re.compile(r"obra|titulo|title")
+
+
+def fold_column_name(c) -> str:
+    """Casefolded, accent-stripped column name; unlike norm_text it keeps punctuation such as "_"."""
+    return strip_accents(str(c).casefold())
 
 
 def detect_candidate_columns(columns: list[str]) -> list[str]:
-    return [c for c in columns if LIKELY_COL_RX.search(str(c))]
+    return [c for c in columns if LIKELY_COL_RX.search(fold_column_name(c))]
 
 
 def detect_title_columns(columns: list[str]) -> list[str]:
-    return [c for c in columns if TITLE_COL_RX.search(str(c))]
+    return [c for c in columns if TITLE_COL_RX.search(fold_column_name(c))]
+
+
+# provider patterns, in priority order
+_PROVIDER_PATTERNS = [
+    ("band", r"\bband\b|bandeirantes"),
+    ("sbt", r"\bsbt\b"),
+    ("globo", r"\bglobo\b|canais globo"),
+    ("globoplay", r"globoplay"),
+    ("ubem", r"ubem"),
+]
+# one match() per path, same lookahead trick as audit_entity_lanes._PROVIDER_RX
+_PROVIDER_RX = re.compile(
+    "^(?:" + "|".join(f"(?=.*?(?P<{name}>{rx}))" for name, rx in _PROVIDER_PATTERNS) + ")",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
 def guess_provider(path: str) -> str:
-    s = str(path)
-    if re.search(r"\bband\b|bandeirantes", s, re.I):
-        return "band"
-    if re.search(r"\bsbt\b", s, re.I):
-        return "sbt"
-    if re.search(r"\bglobo\b|canais globo", s, re.I):
-        return "globo"
-    if re.search(r"globoplay", s, re.I):
-        return "globoplay"
-    if re.search(r"ubem", s, re.I):
-        return "ubem"
-    return "other"
+    m = _PROVIDER_RX.match(str(path))
+    return m.lastgroup if m else "other"
+
+
+def read_csv_arrow(path: Path, *, encoding: str, sep: str, max_rows: int) -> tuple[list[str], pd.DataFrame]:
+    """(columns, candidate columns only) of read_csv(dtype=str, nrows=max_rows).fillna(""), via pyarrow.
+
+    Only the header is parsed up front; pyarrow then converts just the candidate columns (the
+    first column when there are none, which still gives the row count). Raises on anything
+    pandas might read differently, so the caller can fall back to pd.read_csv.
+    """
+    header = read_plain_header(path, encoding=encoding, sep=sep)
+    # pyarrow does not validate utf-8 outside the converted columns, so decode through the
+    # utf-8-sig codec, which checks every byte read
+    codec = "utf-8-sig" if encoding.replace("_", "-").lower() == "utf-8" else encoding
+    picked = detect_candidate_columns(header)[:50] or header[:1]
+    names = [f"f{i}" for i in range(len(header))]
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(encoding=codec, skip_rows=1, column_names=names, block_size=8 << 20),
+        parse_options=pacsv.ParseOptions(delimiter=sep, newlines_in_values=True),
+        convert_options=arrow_string_options(names, include_columns=[names[header.index(c)] for c in picked]),
+    )
+    batches = []
+    n = 0
+    for batch in reader:
+        batches.append(batch)
+        n += batch.num_rows
+        if n >= max_rows:
+            break
+    tbl = pa.Table.from_batches(batches, schema=reader.schema).slice(0, max_rows)
+    df = tbl.to_pandas().fillna("")
+    df.columns = picked
+    return header, df
 
 
 def probe_csv(path: Path, *, max_rows: int) -> tuple[list[str], pd.DataFrame, str, str]:
-    encs = ["utf-8", "utf-8-sig", "latin-1"]
+    """(columns, rows, encoding, repr(sep)) from the first encoding/separator pandas reads without error.
+
+    With pyarrow installed the frame holds only the candidate columns (see read_csv_arrow).
+    """
+    # no "utf-8-sig": pandas already drops a utf-8 BOM, so it could only repeat utf-8's failures
+    encs = ["utf-8", "latin-1"]
     seps = [",", ";", "\t"]
     last = None
     for enc in encs:
         for sep in seps:
+            if pacsv is not None:
+                try:
+                    cols, df = read_csv_arrow(path, encoding=enc, sep=sep, max_rows=max_rows)
+                    return cols, df, enc, repr(sep)
+                except ARROW_CSV_ERRORS:
+                    pass
             try:
                 df = pd.read_csv(path, dtype=str, nrows=max_rows, low_memory=False, encoding=enc, sep=sep)
                 cols = [str(c) for c in df.columns]
@@ -185,6 +348,125 @@ def probe_csv(path: Path, *, max_rows: int) -> tuple[list[str], pd.DataFrame, st
     raise last or RuntimeError("csv probe failed")
 
 
+HitBatch = tuple[list[str], dict[str, dict[str, str]]]
+
+
+def scan_file(fp: Path, *, entities: list[Entity], max_sheets: int, max_rows: int) -> tuple[list[HitBatch], dict | None]:
+    """(hit batches, sampling row) for one file; the sampling row is None when the file leaves no trace.
+
+    A hit batch is (scan_cols, column -> entity_norm -> first matching value) for one sheet or CSV.
+    Hit caps are not applied here: main() applies them while replaying batches in file order, so
+    the outputs do not depend on how files are spread over worker processes.
+    """
+
+    def hit_batch(scan_cols: list[str], values: dict[str, list]) -> HitBatch:
+        # values[c] are the column's distinct values in order of appearance (Series.unique, hashed
+        # in C), so only distinct cells reach the Python matcher
+        return scan_cols, {c: first_entity_matches(entities, values[c]) for c in scan_cols}
+
+    sheets_scanned = 0
+    rows_scanned = 0
+    columns_scanned = 0
+    stop_reason = "ok"
+
+    # CSV/TSV
+    if fp.suffix.lower() in {".csv", ".tsv"}:
+        try:
+            cols, df, enc, sep = probe_csv(fp, max_rows=max_rows)
+        except Exception:
+            return [], {
+                "file_path": str(fp),
+                "sheets_scanned": 1,
+                "rows_scanned": 0,
+                "columns_scanned": 0,
+                "stop_reason": "parse_error",
+            }
+
+        cand = detect_candidate_columns(cols)
+        if not cand:
+            return [], {
+                "file_path": str(fp),
+                "sheets_scanned": 1,
+                "rows_scanned": min(len(df), max_rows),
+                "columns_scanned": 0,
+                "stop_reason": "no_candidate_columns",
+            }
+
+        scan_cols = cand[:50]
+        try:
+            sdf = df[scan_cols].astype(str)
+        except Exception:
+            return [], None
+
+        sheets_scanned = 1
+        rows_scanned = min(len(sdf), max_rows)
+        columns_scanned = len(scan_cols)
+
+        batch = hit_batch(scan_cols, {c: sdf[c].unique().tolist() for c in scan_cols})
+        return [batch], {
+            "file_path": str(fp),
+            "sheets_scanned": sheets_scanned,
+            "rows_scanned": rows_scanned,
+            "columns_scanned": columns_scanned,
+            "stop_reason": stop_reason,
+        }
+
+    # Excel
+    try:
+        xl = pd.ExcelFile(fp)
+        sheet_names = xl.sheet_names
+    except Exception:
+        return [], {
+            "file_path": str(fp),
+            "sheets_scanned": 0,
+            "rows_scanned": 0,
+            "columns_scanned": 0,
+            "stop_reason": "parse_error",
+        }
+
+    batches = []
+    for sh in sheet_names[:max_sheets]:
+        sheets_scanned += 1
+        try:
+            # header peek first; the max_rows read only happens for sheets with columns to scan
+            parse = partial(xl.parse, sh, dtype=str)
+            hdr = parse(nrows=0)
+            cols = [str(c) for c in hdr.columns]
+        except Exception:
+            continue
+
+        cand = detect_candidate_columns(cols)
+        if cand:
+            scan_cols = cand[:50]
+            try:
+                sdf = parse(nrows=max_rows, usecols=scan_cols).fillna("")
+            except Exception:
+                continue
+
+            columns_scanned += len(scan_cols)
+            rows_scanned += len(sdf)
+
+            batches.append(hit_batch(scan_cols, {c: sdf[c].unique().tolist() for c in scan_cols}))
+        else:
+            title_cols = detect_title_columns(cols)
+            if title_cols:
+                try:
+                    # title-only sheets are counted as scanned; no entity matching runs on them
+                    sdf = parse(nrows=max_rows, usecols=title_cols[:5])
+                    rows_scanned += len(sdf)
+                    columns_scanned += len(title_cols[:5])
+                except Exception:
+                    continue
+
+    return batches, {
+        "file_path": str(fp),
+        "sheets_scanned": sheets_scanned,
+        "rows_scanned": rows_scanned,
+        "columns_scanned": columns_scanned,
+        "stop_reason": "ok" if columns_scanned else "no_candidate_columns",
+    }
+
+
 def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--coverage", required=True)
@@ -193,6 +475,13 @@ def main() -> None:
     ap.add_argument("--max-rows", type=int, default=20000)
     ap.add_argument("--variants-cap", type=int, default=500)
     ap.add_argument("--hits-cap-per-entity", type=int, default=200)
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help=f"scan processes (0 = serial below {SERIAL_BELOW_FILES} files, else cpu count; 1 = serial)",
+    )
+    ap.add_argument("--no-cache", action="store_true", help="rescan every file, ignoring out-dir/.cache")
     args = ap.parse_args()
 
     coverage = Path(args.coverage).expanduser()
@@ -233,195 +522,94 @@ def main() -> None:
 
     total_files = len(cov)
 
-    for _, r in cov.iterrows():
-        fp = Path(r["file_path"])
-        if not fp.exists():
-            continue
-
-        provider = r.get("provider_guess", "") or guess_provider(str(fp))
-
-        sheets_scanned = 0
-        rows_scanned = 0
-        columns_scanned = 0
-        stop_reason = "ok"
-
-        # CSV/TSV
-        if fp.suffix.lower() in {".csv", ".tsv"}:
-            try:
-                cols, df, enc, sep = probe_csv(fp, max_rows=args.max_rows)
-            except Exception:
-                sampling_rows.append(
+    def record_hits(fp: Path, provider: str, scan_cols: list[str], firsts: dict[str, dict[str, str]]) -> None:
+        """Record each uncapped entity's first matching value per scanned column of one sheet/file."""
+        active = [ent for ent in entities if ent_hit_count[ent.entity_norm] < args.hits_cap_per_entity]
+        path = str(fp)
+        # hits are emitted in entity-then-column order
+        for ent in active:
+            hit_fields = []
+            sample_values = []
+            for c in scan_cols:
+                v = firsts[c].get(ent.entity_norm)
+                if v is None:
+                    continue
+                hit_fields.append(c)
+                if len(variants_rows) < args.variants_cap and v not in variants_seen[ent.entity_norm]:
+                    variants_seen[ent.entity_norm].add(v)
+                    variants_rows.append(
+                        {"entity_norm": ent.entity_norm, "source_column": c, "raw_variant": v, "file_path": path}
+                    )
+                if len(sample_values) < 3:
+                    sample_values.append(v)
+
+            if hit_fields:
+                ent_hit_count[ent.entity_norm] += 1
+                ent_files[ent.entity_norm].add(path)
+                for hf in hit_fields:
+                    ent_field_counts[ent.entity_norm][hf] += 1
+                file_hits_rows.append(
                     {
-                        "file_path": str(fp),
-                        "sheets_scanned": 1,
-                        "rows_scanned": 0,
-                        "columns_scanned": 0,
-                        "stop_reason": "parse_error",
+                        "file_path": path,
+                        "provider_guess": provider,
+                        "entity_norm": ent.entity_norm,
+                        "hit_fields": ";".join(sorted(set(hit_fields))),
+                        "sample_values": " | ".join(sample_values[:3]),
+                        "confidence": "HIGH" if len(hit_fields) >= 2 else "MED",
                     }
                 )
-                continue
 
-            cand = detect_candidate_columns(cols)
-            if not cand:
-                sampling_rows.append(
-                    {
-                        "file_path": str(fp),
-                        "sheets_scanned": 1,
-                        "rows_scanned": min(len(df), args.max_rows),
-                        "columns_scanned": 0,
-                        "stop_reason": "no_candidate_columns",
-                    }
-                )
-                continue
-
-            scan_cols = cand[:50]
-            try:
-                sdf = df[scan_cols].astype(str)
-            except Exception:
-                continue
-
-            sheets_scanned = 1
-            rows_scanned = min(len(sdf), args.max_rows)
-            columns_scanned = len(scan_cols)
-
-            for ent in entities:
-                if ent_hit_count[ent.entity_norm] >= args.hits_cap_per_entity:
-                    continue
-                hit_fields = []
-                sample_values = []
-                for c in scan_cols:
-                    ser = sdf[c].tolist()[: args.max_rows]
-                    for v in ser:
-                        if not str(v).strip():
-                            continue
-                        if entity_match_in_text(ent, v):
-                            hit_fields.append(c)
-                            if len(variants_rows) < args.variants_cap and v not in variants_seen[ent.entity_norm]:
-                                variants_seen[ent.entity_norm].add(v)
-                                variants_rows.append(
-                                    {"entity_norm": ent.entity_norm, "source_column": c, "raw_variant": v, "file_path": str(fp)}
-                                )
-                            if len(sample_values) < 3:
-                                sample_values.append(v)
-                            break
-
-                if hit_fields:
-                    ent_hit_count[ent.entity_norm] += 1
-                    ent_files[ent.entity_norm].add(str(fp))
-                    for hf in hit_fields:
-                        ent_field_counts[ent.entity_norm][hf] += 1
-                    file_hits_rows.append(
-                        {
-                            "file_path": str(fp),
-                            "provider_guess": provider,
-                            "entity_norm": ent.entity_norm,
-                            "hit_fields": ";".join(sorted(set(hit_fields))),
-                            "sample_values": " | ".join(sample_values[:3]),
-                            "confidence": "HIGH" if len(hit_fields) >= 2 else "MED",
-                        }
-                    )
-
-            sampling_rows.append(
-                {
-                    "file_path": str(fp),
-                    "sheets_scanned": sheets_scanned,
-                    "rows_scanned": rows_scanned,
-                    "columns_scanned": columns_scanned,
-                    "stop_reason": stop_reason,
-                }
-            )
-            continue
-
-        # Excel
-        try:
-            xl = pd.ExcelFile(fp)
-            sheet_names = xl.sheet_names
-        except Exception:
-            sampling_rows.append(
-                {
-                    "file_path": str(fp),
-                    "sheets_scanned": 0,
-                    "rows_scanned": 0,
-                    "columns_scanned": 0,
-                    "stop_reason": "parse_error",
-                }
-            )
+    provs = cov["provider_guess"].tolist() if "provider_guess" in cov.columns else [""] * len(cov)
+    todo = []
+    for fp_str, provider in zip(cov["file_path"].tolist(), provs):
+        fp = Path(fp_str)
+        if not fp.exists():
             continue
+        todo.append((fp, provider or guess_provider(str(fp))))
+
+    scan = partial(scan_file, entities=entities, max_sheets=args.max_sheets, max_rows=args.max_rows)
+    if not args.no_cache:
+        cache_dir = open_cache(
+            out_dir / ".cache",
+            "audit_top_entities_frequency",
+            [(e.entity_norm, e.priority) for e in entities],
+            {"max_sheets": args.max_sheets, "max_rows": args.max_rows},
+        )
+        scan = partial(cached_call, scan, cache_dir=cache_dir)
+    paths = [fp for fp, _ in todo]
+    workers = pool_workers(args.workers, len(paths))
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    results = map(scan, paths) if pool is None else pool.map(scan, paths, chunksize=4)
 
-        for sh in sheet_names[: args.max_sheets]:
-            sheets_scanned += 1
-            try:
-                hdr = xl.parse(sh, dtype=str, nrows=0)
-                cols = [str(c) for c in hdr.columns]
-            except Exception:
-                continue
-
-            cand = detect_candidate_columns(cols)
-            if cand:
-                scan_cols = cand[:50]
-                try:
-                    sdf = xl.parse(sh, dtype=str, nrows=args.max_rows, usecols=scan_cols).fillna("")
-                except Exception:
-                    continue
-
-                columns_scanned += len(scan_cols)
-                rows_scanned += len(sdf)
-
-                for ent in entities:
-                    if ent_hit_count[ent.entity_norm] >= args.hits_cap_per_entity:
-                        continue
-                    hit_fields = []
-                    sample_values = []
-                    for c in scan_cols:
-                        ser = sdf[c].astype(str).tolist()
-                        for v in ser:
-                            if not str(v).strip():
-                                continue
-                            if entity_match_in_text(ent, v):
-                                hit_fields.append(c)
-                                if len(variants_rows) < args.variants_cap and v not in variants_seen[ent.entity_norm]:
-                                    variants_seen[ent.entity_norm].add(v)
-                                    variants_rows.append(
-                                        {"entity_norm": ent.entity_norm, "source_column": c, "raw_variant": v, "file_path": str(fp)}
-                                    )
-                                if len(sample_values) < 3:
-                                    sample_values.append(v)
-                                break
-
-                    if hit_fields:
-                        ent_hit_count[ent.entity_norm] += 1
-                        ent_files[ent.entity_norm].add(str(fp))
-                        for hf in hit_fields:
-                            ent_field_counts[ent.entity_norm][hf] += 1
-                        file_hits_rows.append(
-                            {
-                                "file_path": str(fp),
-                                "provider_guess": provider,
-                                "entity_norm": ent.entity_norm,
-                                "hit_fields": ";".join(sorted(set(hit_fields))),
-                                "sample_values": " | ".join(sample_values[:3]),
-                                "confidence": "HIGH" if len(hit_fields) >= 2 else "MED",
-                            }
-                        )
-            else:
-                title_cols = detect_title_columns(cols)
-                if title_cols:
-                    try:
-                        sdf = xl.parse(sh, dtype=str, nrows=args.max_rows, usecols=title_cols[:5]).fillna("")
-                        # long-title scan (debug only)
-                        _ = int((sdf.astype(str).applymap(len) >= 12).any(axis=1).sum())
-                        rows_scanned += len(sdf)
-                        columns_scanned += len(title_cols[:5])
-                    except Exception:
-                        continue
+    def saturated() -> bool:
+        return all(ent_hit_count[ent.entity_norm] >= args.hits_cap_per_entity for ent in entities)
 
+    # replayed in coverage order, so hit caps fall on the same files as in a serial run
+    done = 0
+    try:
+        for fp, provider in todo:
+            if saturated():
+                break
+            batches, sampling = next(results)
+            for scan_cols, firsts in batches:
+                record_hits(fp, provider, scan_cols, firsts)
+            if sampling is not None:
+                sampling_rows.append(sampling)
+            done += 1
+    finally:
+        if pool is not None:
+            # files still queued once every entity is capped are never scanned
+            pool.shutdown(cancel_futures=True)
+
+    # with every entity capped no further hit or variant can be recorded
+    for fp, _ in todo[done:]:
         sampling_rows.append(
             {
                 "file_path": str(fp),
-                "sheets_scanned": sheets_scanned,
-                "rows_scanned": rows_scanned,
-                "columns_scanned": columns_scanned,
-                "stop_reason": "ok" if columns_scanned else "no_candidate_columns",
+                "sheets_scanned": 0,
+                "rows_scanned": 0,
+                "columns_scanned": 0,
+                "stop_reason": "cap_reached",
             }
         )
 
@@ -449,9 +637,10 @@ def main() -> None:
     out_sampling = out_dir / "top_entity_sampling_coverage.txt"
     out_zero = out_dir / "top_entity_zero_reasons.csv"
 
-    pd.DataFrame(fc_rows).sort_values(["files_hit_count", "hit_count"], ascending=[False, False]).to_csv(out_fc, index=False)
-    pd.DataFrame(file_hits_rows).to_csv(out_hits, index=False)
-    pd.DataFrame(variants_rows).head(args.variants_cap).to_csv(out_vars, index=False)
+    # sorted() is stable, like the multi-key sort_values it replaces
+    write_rows_csv(sorted(fc_rows, key=lambda r: (-r["files_hit_count"], -r["hit_count"])), out_fc)
+    write_rows_csv(file_hits_rows, out_hits)
+    write_rows_csv(variants_rows[: args.variants_cap], out_vars)
 
     # sampling coverage text
     lines = []
@@ -475,7 +664,7 @@ def main() -> None:
                 "max_sheets": args.max_sheets,
             }
         )
-    pd.DataFrame(zrows).to_csv(out_zero, index=False)
+    write_rows_csv(zrows, out_zero)
 
     print(f"Wrote: {out_fc}")
     print(f"Wrote: {out_hits}")
@@ -35,6 +35,13 @@ FIELD_RX = {
     "rightsholder_owner": re.compile(r"\b(titular|titulares|direitos|owner|propriet|sociedade|editora|editoras|publisher)\b", re.I),
 }
 
+# one pass per header: each branch looks ahead over the whole string, and branches
+# are tried in FIELD_RX order, so the earliest-listed field that matches anywhere wins
+FIELD_MATCH_RX = re.compile(
+    "|".join(f"(?=.*?{rx.pattern})(?P<{k}>)" for k, rx in FIELD_RX.items()),
+    re.I | re.S,
+)
+
 
 def main() -> None:
     ap = argparse.ArgumentParser()
@@ -44,25 +51,31 @@ def main() -> None:
 
     df = pd.read_csv(args.templates, dtype=str, low_memory=False).fillna("")
 
+    def column(name: str) -> list[str]:
+        return df[name].astype(str).tolist() if name in df.columns else [""] * len(df)
+
+    # the same normalized headers recur across templates: classify each distinct one once
+    field_of: dict[str, str] = {}
+
+    def field_for(norm_h: str) -> str:
+        field = field_of.get(norm_h)
+        if field is None:
+            m = FIELD_MATCH_RX.match(norm_h)
+            field = m.lastgroup if m else "other"
+            field_of[norm_h] = field
+        return field
+
     rows = []
-    for _, r in df.iterrows():
-        prov = r.get("provider_guess", "")
-        raw = str(r.get("example_header_row", ""))
-        norm = str(r.get("col_headers_normalized", ""))
+    for prov, raw, norm in zip(column("provider_guess"), column("example_header_row"), column("col_headers_normalized")):
         raw_parts = raw.split("|") if raw else []
         norm_parts = norm.split("|") if norm else []
 
         for raw_h, norm_h in zip(raw_parts, norm_parts):
             if not norm_h:
                 continue
-            field = "other"
-            for k, rx in FIELD_RX.items():
-                if rx.search(norm_h):
-                    field = k
-                    break
             rows.append(
                 {
-                    "field": field,
+                    "field": field_for(norm_h),
                     "header_norm": norm_h,
                     "raw_header": raw_h,
                     "provider_guess": prov,
@@ -14,6 +14,9 @@ Strategy:
   - col_headers_normalized (normalized column names)
   - example_header_row (raw header names joined)
 
+Per-workbook samples are cached in .cache next to --out and reused while the workbook's
+mtime/size (and the sampling settings) are unchanged, unless --no-cache.
+
 NOTE: This is metadata-only; not a full extraction.
 """
 
@@ -22,40 +25,67 @@ from __future__ import annotations
 import argparse
 import os
 import re
-import unicodedata
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
 
+# scripts/ is not a Python package; add it to sys.path for local imports
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from field_detection import norm_header  # noqa: E402
+from file_cache import cached_call, open_cache  # noqa: E402
+from workers import SERIAL_BELOW_FILES, pool_workers  # noqa: E402
 
 PROVIDERS = [
-    ("band", re.compile(r"\bband\b|bandeirantes", re.I)),
-    ("sbt", re.compile(r"\bsbt\b", re.I)),
-    ("globo", re.compile(r"\bglobo\b|canais globo", re.I)),
-    ("globoplay", re.compile(r"globoplay", re.I)),
-    ("ubem", re.compile(r"ubem", re.I)),
+    ("band", r"\bband\b|bandeirantes"),
+    ("sbt", r"\bsbt\b"),
+    ("globo", r"\bglobo\b|canais globo"),
+    ("globoplay", r"globoplay"),
+    ("ubem", r"ubem"),
 ]
 
+# the first listed provider found anywhere in the path wins
+PROVIDER_RX = re.compile(
+    "^(?:" + "|".join(f"(?=.*?(?P<{name}>{rx}))" for name, rx in PROVIDERS) + ")",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 def guess_provider(path: str) -> str:
-    s = str(path)
-    for name, rx in PROVIDERS:
-        if rx.search(s):
-            return name
-    return "other"
+    m = PROVIDER_RX.match(str(path))
+    return m.lastgroup if m else "other"
 
 
-def strip_accents(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s)
-    return "".join(ch for ch in s if not unicodedata.combining(ch))
+def sample_workbook(prov: str, p: Path, *, max_sheets: int, sample_rows: int) -> list[dict]:
+    """Header sample rows for one (provider, workbook); unreadable workbooks or sheets are skipped."""
+    try:
+        xl = pd.ExcelFile(p)
+    except Exception:
+        return []
 
+    rows = []
+    for sh in xl.sheet_names[:max_sheets]:
+        try:
+            df = xl.parse(sh, dtype=str, nrows=sample_rows)
+        except Exception:
+            continue
 
-def norm_header(s: str) -> str:
-    s = "" if s is None else str(s)
-    s = strip_accents(s.casefold())
-    s = re.sub(r"[^0-9a-z]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+        headers = [str(c) for c in df.columns]
+        headers_norm = [norm_header(c) for c in headers]
+        rows.append(
+            {
+                "provider_guess": prov,
+                "file_path": str(p),
+                "sheet_name": str(sh),
+                "row_count": int(len(df)),
+                "col_headers_normalized": "|".join(headers_norm),
+                "example_header_row": "|".join(headers),
+            }
+        )
+    return rows
 
 
 def main() -> None:
@@ -65,6 +95,13 @@ def main() -> None:
     ap.add_argument("--limit", type=int, default=40)
     ap.add_argument("--max-sheets", type=int, default=6)
     ap.add_argument("--sample-rows", type=int, default=200)
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help=f"sampling processes (0 = serial below {SERIAL_BELOW_FILES} files, else cpu count; 1 = serial)",
+    )
+    ap.add_argument("--no-cache", action="store_true", help="resample every workbook, ignoring the .cache next to --out")
     args = ap.parse_args()
 
     roots = [Path(r).expanduser() for r in args.root]
@@ -90,34 +127,27 @@ def main() -> None:
             continue
     cands2.sort(key=lambda x: x[2], reverse=True)
 
-    rows = []
-    for prov, p, _sz in cands2[: args.limit]:
-        try:
-            xl = pd.ExcelFile(p)
-        except Exception:
-            continue
-
-        for sh in xl.sheet_names[: args.max_sheets]:
-            try:
-                df = xl.parse(sh, dtype=str, nrows=args.sample_rows)
-            except Exception:
-                continue
-
-            headers = [str(c) for c in df.columns]
-            headers_norm = [norm_header(c) for c in headers]
-            rows.append(
-                {
-                    "provider_guess": prov,
-                    "file_path": str(p),
-                    "sheet_name": str(sh),
-                    "row_count": int(len(df)),
-                    "col_headers_normalized": "|".join(headers_norm),
-                    "example_header_row": "|".join(headers),
-                }
-            )
-
     out = Path(args.out).expanduser()
     out.parent.mkdir(parents=True, exist_ok=True)
+
+    picked = [(prov, p) for prov, p, _sz in cands2[: args.limit]]
+    sample = partial(sample_workbook, max_sheets=args.max_sheets, sample_rows=args.sample_rows)
+    if not args.no_cache:
+        cache_dir = open_cache(
+            out.parent / ".cache",
+            "build_known_good_template_set",
+            {"max_sheets": args.max_sheets, "sample_rows": args.sample_rows},
+        )
+        sample = partial(cached_call, sample, cache_dir=cache_dir, src=1)
+    workers = pool_workers(args.workers, len(picked))
+    if workers == 1:
+        results = [sample(prov, p) for prov, p in picked]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            provs, paths = [prov for prov, _ in picked], [p for _, p in picked]
+            results = list(ex.map(sample, provs, paths, chunksize=4))
+    rows = [r for file_rows in results for r in file_rows]
+
     pd.DataFrame(rows).to_csv(out, index=False)
     print(f"Wrote: {out} rows={len(rows)}")
 
@@ -19,6 +19,8 @@ Also supports generating an action sheet:
 Notes
 - We trust the sweep CSV to already be filtered to matched tiers.
 - Provider guess is path-based heuristic.
+- Parsed sweep / previously-reviewed frames are pickled in out-dir/.cache and reused while
+  the CSV's mtime/size are unchanged, unless --no-cache.
 """
 
 from __future__ import annotations
@@ -26,6 +28,7 @@ from __future__ import annotations
 import argparse
 import re
 import unicodedata
+from functools import lru_cache, partial
 from pathlib import Path
 
 import sys
@@ -35,27 +38,34 @@ import pandas as pd
 # scripts/ is not a Python package; add it to sys.path for local imports
 sys.path.append(str(Path(__file__).resolve().parent))
 
+from csv_io import ARROW_CSV_ERRORS, arrow_string_options, pacsv, read_plain_header  # noqa: E402
 from entity_overrides import compute_entity_override_hits, load_entity_overrides, load_top_entities  # noqa: E402
+from file_cache import cached_call, open_cache  # noqa: E402
 
 
 PROVIDERS = [
-    ("band", re.compile(r"\bband\b|bandeirantes", re.I)),
-    ("sbt", re.compile(r"\bsbt\b", re.I)),
-    ("globo", re.compile(r"\bglobo\b|canais globo", re.I)),
-    ("globoplay", re.compile(r"globoplay", re.I)),
-    ("record", re.compile(r"\brecord\b", re.I)),
-    ("canalbrasil", re.compile(r"canal\s*brasil", re.I)),
-    ("ubem", re.compile(r"ubem", re.I)),
-    ("ecad", re.compile(r"ecad", re.I)),
+    ("band", r"\bband\b|bandeirantes"),
+    ("sbt", r"\bsbt\b"),
+    ("globo", r"\bglobo\b|canais globo"),
+    ("globoplay", r"globoplay"),
+    ("record", r"\brecord\b"),
+    ("canalbrasil", r"canal\s*brasil"),
+    ("ubem", r"ubem"),
+    ("ecad", r"ecad"),
 ]
 
+# lookaheads keep PROVIDERS priority: earliest entry that matches anywhere wins
+PROVIDER_RX = re.compile(
+    "^(?:" + "|".join(f"(?=.*?(?P<{name}>{rx}))" for name, rx in PROVIDERS) + ")",
+    re.IGNORECASE | re.DOTALL,
+)
 
+
+# sweep rows repeat the same fornecedor_file many times over
+@lru_cache(maxsize=100_000)
 def guess_provider(path: str) -> str:
-    s = str(path)
-    for name, rx in PROVIDERS:
-        if rx.search(s):
-            return name
-    return "other"
+    m = PROVIDER_RX.match(str(path))
+    return m.lastgroup if m else "other"
 
 
 def strip_accents(s: str) -> str:
@@ -63,6 +73,8 @@ def strip_accents(s: str) -> str:
     return "".join(ch for ch in s if not unicodedata.combining(ch))
 
 
+# titles and credit cells repeat across sweep rows; typed so 1 and 1.0 keep distinct results
+@lru_cache(maxsize=1 << 17, typed=True)
 def norm(s: str) -> str:
     s = "" if s is None else str(s)
     s = strip_accents(s.casefold().strip())
@@ -70,6 +82,30 @@ def norm(s: str) -> str:
     return s
 
 
+def read_csv_str(path: Path) -> pd.DataFrame:
+    """pd.read_csv(path, dtype=str, low_memory=False).fillna(""), parsed by pyarrow when it can be.
+
+    Headers pandas would mangle (blank or duplicate names) and rows pyarrow rejects (ragged
+    field counts, whitespace-only lines) go to pandas, which decides as before.
+    """
+    if pacsv is not None:
+        try:
+            header = read_plain_header(path)
+            names = [f"f{i}" for i in range(len(header))]
+            tbl = pacsv.read_csv(
+                path,
+                read_options=pacsv.ReadOptions(skip_rows=1, column_names=names, block_size=8 << 20),
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                convert_options=arrow_string_options(names),
+            )
+            df = tbl.to_pandas().fillna("")
+            df.columns = header
+            return df
+        except ARROW_CSV_ERRORS:
+            pass
+    return pd.read_csv(path, dtype=str, low_memory=False).fillna("")
+
+
 def tier_weight(tier: str) -> int:
     t = (tier or "").strip().lower()
     return {"gold": 3, "silver": 2, "bronze": 1}.get(t, 0)
@@ -77,7 +113,9 @@ def tier_weight(tier: str) -> int:
 
 def compute_rank(df: pd.DataFrame) -> pd.DataFrame:
     out = df.copy()
-    out["tier_weight"] = out["tier"].map(tier_weight)
+    # a handful of distinct tier labels: weigh each once
+    weights = {t: tier_weight(t) for t in out["tier"].unique()}
+    out["tier_weight"] = out["tier"].map(weights)
     out["score_num"] = pd.to_numeric(out.get("tier_weight", 0), errors="coerce").fillna(0).astype(int)
     flags = out.get("evidence_flags", "").astype(str)
     out["has_id_evidence"] = (
@@ -113,6 +151,7 @@ def main() -> None:
     ap.add_argument("--sweep", required=True)
     ap.add_argument("--out-dir", required=True)
     ap.add_argument("--top-silver", type=int, default=300)
+    ap.add_argument("--no-cache", action="store_true", help="reparse the input CSVs, ignoring out-dir/.cache")
     args = ap.parse_args()
 
     # scored is currently not used because sweep already contains all row fields we need.
@@ -121,8 +160,13 @@ def main() -> None:
     out_dir = Path(args.out_dir).expanduser()
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    read_csv = read_csv_str
+    if not args.no_cache:
+        cache_dir = open_cache(out_dir / ".cache", "build_match_report")
+        read_csv = partial(cached_call, read_csv_str, cache_dir=cache_dir)
+
     # Sweep already contains the rows of interest (with source_file/sheet/row)
-    sw = pd.read_csv(sweep, dtype=str, low_memory=False).fillna("")
+    sw = read_csv(sweep)
 
     # Normalize sweep columns to report schema
     colmap = {
@@ -192,7 +236,7 @@ def main() -> None:
 
     # previously reviewed (may be empty)
     prev_path = Path(__file__).resolve().parent.parent / "config/previously_reviewed_matches.csv"
-    prev = pd.read_csv(prev_path, dtype=str, low_memory=False).fillna("") if prev_path.exists() else pd.DataFrame()
+    prev = read_csv(prev_path) if prev_path.exists() else pd.DataFrame()
 
     def _ref_id_key(df: pd.DataFrame) -> pd.Series:
         return df.get("ref_isrc", "").astype(str).str.strip() + "|" + df.get("ref_iswc", "").astype(str).str.strip()
@@ -217,6 +261,11 @@ def main() -> None:
     rows.loc[m_top, "is_match"] = 1
     rows.loc[m_top & (rows["match_reason"] == ""), "match_reason"] = "TOP_ENTITY"
 
+    # fornecedor_file+sheet+row_id identity as int codes, shared by every dedup below
+    rows["_k"] = pd.factorize(
+        pd.MultiIndex.from_arrays([rows["fornecedor_file"], rows["sheet"], rows["row_id"].astype(str)])
+    )[0]
+
     # Write match_report_rows.csv
     rows_out = out_dir / "match_report_rows.csv"
     out_cols = base_cols + [
@@ -235,7 +284,6 @@ def main() -> None:
     if "entity_override_hit" in rows.columns:
         eh = rows[rows["entity_override_hit"] == 1].copy()
         if len(eh):
-            eh["_k"] = eh["fornecedor_file"] + "||" + eh["sheet"] + "||" + eh["row_id"].astype(str)
             eh = eh.drop_duplicates("_k")
             eh = compute_rank(eh)
             eh[out_cols].to_csv(out_dir / "entity_override_hits.csv", index=False)
@@ -256,7 +304,6 @@ def main() -> None:
     # ALWAYS_MATCH_POLICY outputs
     # top_entity_matches.csv: all rows forced match by TOP_ENTITY or PREVIOUSLY_REVIEWED
     forced = rows[rows["is_match"] == 1].copy()
-    forced["_k"] = forced["fornecedor_file"] + "||" + forced["sheet"] + "||" + forced["row_id"].astype(str)
     forced_dedup = forced.drop_duplicates("_k")
 
     forced_rank = compute_rank(forced_dedup)
@@ -341,6 +388,7 @@ def main() -> None:
 
         for ent in top_entities:
             ent_norm = ent.entity_norm
+            ent_joined = ent_norm.replace(" ", "")
             # rows where this entity hit
             m = rows.get("top_entity_entities", "").astype(str).str.contains(ent_norm, na=False)
             if not int(m.sum()):
@@ -352,7 +400,7 @@ def main() -> None:
                     if not v.strip():
                         continue
                     # only keep variants that plausibly contain the entity tokens
-                    if ent_norm.replace(" ", "") not in norm(v).replace(" ", ""):
+                    if ent_joined not in norm(v).replace(" ", ""):
                         continue
                     vv = v.strip()
                     if vv in seen:
@@ -364,38 +412,48 @@ def main() -> None:
 
     pd.DataFrame(variants).to_csv(out_dir / "top_entity_raw_variants.csv", index=False)
 
+    # normalized once; the dedup, overview and breadth sections all use it
+    title_norm = rows["matched_title"].map(norm)
+
     # Dedup report
     d = rows.copy()
-    d["matched_title_norm"] = d["matched_title"].map(norm)
+    d["matched_title_norm"] = title_norm
     d["ref_id_key"] = d.get("ref_isrc", "").astype(str).str.strip() + "|" + d.get("ref_iswc", "").astype(str).str.strip()
     d["group_key"] = d["matched_title_norm"] + "|" + d["ref_id_key"]
 
-    def top_files(series, n=5):
-        vc = series.value_counts().head(n)
-        return "; ".join([f"{idx}:{cnt}" for idx, cnt in vc.items()])
+    # top_files: each group's 5 most frequent files as value_counts would list them,
+    # by count descending with ties kept in order of first appearance
+    tf = d.groupby(["group_key", "fornecedor_file"], sort=False).size().reset_index(name="cnt")
+    tf = tf.sort_values(["group_key", "cnt"], ascending=[True, False], kind="stable").groupby("group_key").head(5)
+    tf["item"] = tf["fornecedor_file"] + ":" + tf["cnt"].astype(str)
+    top_files = tf.groupby("group_key")["item"].agg("; ".join)
 
     dedup = d.groupby("group_key", as_index=False).agg(
         total_occurrences=("group_key", "count"),
-        distinct_files=("fornecedor_file", lambda x: x.nunique()),
-        top_files=("fornecedor_file", top_files),
+        distinct_files=("fornecedor_file", "nunique"),
         example_matched_title=("matched_title", "first"),
         ref_isrc=("ref_isrc", "first"),
         ref_iswc=("ref_iswc", "first"),
     )
+    dedup.insert(3, "top_files", dedup["group_key"].map(top_files))
     dedup = dedup.sort_values(["total_occurrences", "distinct_files"], ascending=[False, False])
     dedup_out = out_dir / "match_report_dedup.csv"
     dedup.to_csv(dedup_out, index=False)
 
-    # Evidence flags
-    flags = rows.get("evidence_flags", "").astype(str)
-    has_ref_id = rows.get("ref_isrc", "").astype(str).str.strip().ne("") | rows.get("ref_iswc", "").astype(str).str.strip().ne("")
-    # has_any_id could be useful later for QC; currently unused.
-    has_title_exact = flags.str.contains("TITLE_EXACT", case=False, na=False)
-    has_artist_overlap = flags.str.contains("ARTIST_TOKEN_OVERLAP", case=False, na=False)
+    # Evidence flags: compute_rank already derived them from evidence_flags
+    ref_ids = _ref_id_key(rows)
+    has_ref_id = ref_ids != "|"
+    has_title_exact = rows["has_title_exact"]
+    has_artist_overlap = rows["has_artist_overlap"]
+
+    tier_lower = rows["tier"].str.lower()
+    is_gold = tier_lower == "gold"
+    is_silver = tier_lower == "silver"
+    is_gold_or_silver = is_gold | is_silver
 
     # Truth gaps: strong evidence but missing reference IDs
     truth_gaps = rows[
-        (rows["tier"].str.lower().isin(["gold", "silver"]))
+        is_gold_or_silver
         & has_title_exact
         & has_artist_overlap
         & (~has_ref_id)
@@ -404,36 +462,27 @@ def main() -> None:
     truth_gaps[out_cols].to_csv(truth_gaps_out, index=False)
 
     # Suspects: weak-evidence rows only (quality control)
-    suspects = rows[
-        (
-            rows["tier"].str.lower().isin(["gold", "silver"])
-            & (~has_title_exact)
-            & (~has_artist_overlap)
-        )
-        | ((rows["tier"].str.lower() == "silver") & (~has_title_exact) & (~has_artist_overlap))
-    ].copy()
+    suspects = rows[is_gold_or_silver & (~has_title_exact) & (~has_artist_overlap)].copy()
 
     suspects_out = out_dir / "match_report_suspects.csv"
     suspects[out_cols].to_csv(suspects_out, index=False)
 
     # Overview
     tier_counts = rows["tier"].value_counts().to_dict()
-    ref_ids = rows.get("ref_isrc", "").astype(str).str.strip() + "|" + rows.get("ref_iswc", "").astype(str).str.strip()
-    nonempty_ref_id = ref_ids != "|"
-    unique_ref_id_key_count = int(ref_ids[nonempty_ref_id].nunique())
+    unique_ref_id_key_count = int(ref_ids[has_ref_id].nunique())
 
-    unique_ref_title_norm_count = int(
-        rows.get("matched_title", "").astype(str).str.strip().replace({"nan": ""}).map(norm).replace({"": None}).dropna().nunique()
-    )
+    # a literal "nan" title counts as blank here, unlike in the dedup and breadth keys
+    counted = rows["matched_title"].astype(str).str.strip().ne("nan") & title_norm.ne("")
+    unique_ref_title_norm_count = int(title_norm[counted].nunique())
 
-    top_ref_ids = ref_ids[nonempty_ref_id].value_counts().head(20)
+    top_ref_ids = ref_ids[has_ref_id].value_counts().head(20)
 
     top_files_by_matches = rows["fornecedor_file"].value_counts().head(20)
-    top_files_by_gold = rows[rows["tier"].str.lower() == "gold"]["fornecedor_file"].value_counts().head(20)
+    top_files_by_gold = rows[is_gold]["fornecedor_file"].value_counts().head(20)
 
     # Top ref titles by UNIQUE fornecedor_file count (breadth)
     breadth = rows.copy()
-    breadth["matched_title_norm"] = breadth["matched_title"].map(norm)
+    breadth["matched_title_norm"] = title_norm
     breadth = breadth[breadth["matched_title_norm"].ne("")]
     breadth_vc = breadth.groupby("matched_title_norm")["fornecedor_file"].nunique().sort_values(ascending=False).head(20)
 
@@ -463,14 +512,11 @@ def main() -> None:
     (out_dir / "match_report_overview.md").write_text("\n".join(overview) + "\n", encoding="utf-8")
 
     # Action sheet
-    gold = rows[rows["tier"].str.lower() == "gold"].copy()
-    silver = rows[rows["tier"].str.lower() == "silver"].copy()
+    gold = rows[is_gold].copy()
+    silver = rows[is_silver].copy()
 
     # Dedup by fornecedor_file+sheet+row_id
-    gold["_k"] = gold["fornecedor_file"] + "||" + gold["sheet"] + "||" + gold["row_id"].astype(str)
-    silver["_k"] = silver["fornecedor_file"] + "||" + silver["sheet"] + "||" + silver["row_id"].astype(str)
-
-    silver = silver[~silver["_k"].isin(set(gold["_k"]))]
+    silver = silver[~silver["_k"].isin(gold["_k"])]
     silver = silver.head(args.top_silver)
 
     action = pd.concat([gold, silver], ignore_index=True)
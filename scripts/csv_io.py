@@ -0,0 +1,79 @@
+"""Shared CSV helpers for the audit/report scripts.
+
+- write_rows_csv: pd.DataFrame(rows).to_csv(index=False), written straight from the row dicts
+- PD_NA_VALUES: pandas' default NA strings, the cells read_csv(...).fillna("") blanks
+- read_plain_header: the header row of a CSV pyarrow can read the way pandas does, else ValueError
+- arrow_string_options: all-string pyarrow ConvertOptions that null PD_NA_VALUES like pandas
+- ARROW_CSV_ERRORS: what a read_plain_header + pyarrow read raises before the pandas fallback
+
+pa / pacsv are None without pyarrow; the scripts then read with pandas only.
+"""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pandas as pd
+
+# optional fast CSV path; every caller falls back to pandas without it
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+# unreadable file, bad bytes or a refused header (OSError, ValueError, csv.Error), or a row
+# pyarrow rejects (ArrowInvalid and friends)
+ARROW_CSV_ERRORS = (OSError, ValueError, csv.Error) + ((pa.ArrowException,) if pa is not None else ())
+
+# pandas' default NA strings: the Arrow path blanks the same cells as read_csv(...).fillna("")
+PD_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+def write_rows_csv(rows: list[dict], path: Path) -> None:
+    """Same bytes as pd.DataFrame(rows).to_csv(index=False), without building the DataFrame.
+
+    Rows are expected to share one set of keys, as the audit rows do: pandas would turn an int
+    column with gaps into floats, which csv.DictWriter does not.
+    """
+    if not rows:
+        pd.DataFrame(rows).to_csv(path, index=False)
+        return
+    fields = list(dict.fromkeys(k for r in rows for k in r))
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=fields, lineterminator="\n")
+        w.writeheader()
+        w.writerows(rows)
+
+
+def read_plain_header(path: Path, *, encoding: str = "utf-8", sep: str = ",") -> list[str]:
+    """First CSV row, BOM dropped; ValueError unless pandas would take it as-is.
+
+    That is a header on one line with at least two names, none blank or repeated (pandas renames
+    those) and no BOM left by a non-utf-8 codec. One-column reads are refused because pyarrow
+    keeps the whitespace-only lines pandas skips.
+    """
+    codec = "utf-8-sig" if encoding.replace("_", "-").lower() == "utf-8" else encoding
+    with open(path, encoding=codec, newline="") as f:
+        rd = csv.reader(f, delimiter=sep)
+        header = next(rd, [])
+    if rd.line_num > 1:
+        raise ValueError("header does not sit on the first line")
+    if len(header) < 2 or "" in header or len(set(header)) != len(header) or header[0].startswith("\xef\xbb\xbf"):
+        raise ValueError("header needs pandas-style parsing")
+    return header
+
+
+def arrow_string_options(names: list[str], **kwds) -> pacsv.ConvertOptions:
+    """ConvertOptions reading every column in names as a string, PD_NA_VALUES as null."""
+    return pacsv.ConvertOptions(
+        column_types={n: pa.string() for n in names},
+        null_values=PD_NA_VALUES,
+        strings_can_be_null=True,
+        **kwds,
+    )
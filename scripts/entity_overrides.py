@@ -32,7 +32,6 @@ def strip_accents(s: str) -> str:
 
 
 _NON_ALNUM = re.compile(r"[^0-9a-z]+")
-_WS = re.compile(r"\s+")
 
 
 def norm_text(s: str) -> str:
@@ -40,14 +39,12 @@ def norm_text(s: str) -> str:
 
     - casefold
     - strip accents
-    - convert any non-alphanumeric to space
-    - collapse whitespace
+    - convert each run of non-alphanumerics (whitespace included) to one space
     """
 
     s = "" if s is None else str(s)
     s = strip_accents(s.casefold())
-    s = _NON_ALNUM.sub(" ", s)
-    s = _WS.sub(" ", s).strip()
+    s = _NON_ALNUM.sub(" ", s).strip()
     return s
 
 
@@ -214,47 +211,57 @@ def compute_entity_override_hits(
     hit_fields: list[list[str]] = [[] for _ in range(len(out))]
     best_priority = [0] * len(out)
 
-    # Precompute token sets per field for each row to make matching cheaper
-    field_tokens = {}
+    # Index entities by their first token: a row can only hit entities whose first token it has.
+    # Results are kept by row position, so they land on the right rows whatever df's index is.
+    ent_toks = [set(ent.tokens) for ent in overrides]
+    by_first: dict[str, list[int]] = {}
+    for k, ent in enumerate(overrides):
+        if ent_toks[k]:
+            by_first.setdefault(ent.tokens[0], []).append(k)
+
+    # hit_rows[k][f]: positions of the rows whose field f holds every token of overrides[k]
+    hit_rows: list[dict[str, list[int]]] = [{} for _ in overrides]
     for f in available_fields:
-        field_tokens[f] = out[f].astype(str).map(field_token_set)
+        token_sets: dict[str, set[str]] = {}  # field values repeat; tokenize each distinct one once
+        for i, v in enumerate(out[f].astype(str).tolist()):
+            toks = token_sets.get(v)
+            if toks is None:
+                toks = token_sets[v] = field_token_set(v)
+            for t in toks:
+                for k in by_first.get(t, ()):
+                    if ent_toks[k] <= toks:
+                        hit_rows[k].setdefault(f, []).append(i)
 
     # Per-entity counters
     stats = {}
 
-    for ent in overrides:
-        ent_toks = set(ent.tokens)
-        if not ent_toks:
+    # record in entity, then field, then row order
+    for k, ent in enumerate(overrides):
+        if not hit_rows[k]:
             continue
 
-        hit_mask = pd.Series([False] * len(out))
+        hit_any: set[int] = set()
         field_breakdown = {f: 0 for f in available_fields}
 
         for f in available_fields:
-            m = field_tokens[f].map(lambda s: ent_toks.issubset(s))
-            if bool(m.any()):
-                hit_mask = hit_mask | m
-                field_breakdown[f] += int(m.sum())
-
-                # record hits row-wise
-                idxs = m[m].index.tolist()
-                for i in idxs:
-                    hit_entities[i].append(ent.entity_norm)
-                    hit_fields[i].append(f"{ent.entity_norm}@{f}")
-                    if ent.priority > best_priority[i]:
-                        best_priority[i] = ent.priority
-
-        total_hits = int(hit_mask.sum())
-        if total_hits:
-            stats[ent.entity_norm] = {
-                "entity_norm": ent.entity_norm,
-                "entity_type": ent.entity_type,
-                "priority": ent.priority,
-                "requires_coevidence": ent.requires_coevidence,
-                "per_term_cap": ent.per_term_cap or "",
-                "hit_count": total_hits,
-                "hit_field_breakdown": ",".join(f"{k}:{v}" for k, v in field_breakdown.items() if v),
-            }
+            idxs = hit_rows[k].get(f, [])
+            hit_any.update(idxs)
+            field_breakdown[f] += len(idxs)
+            for i in idxs:
+                hit_entities[i].append(ent.entity_norm)
+                hit_fields[i].append(f"{ent.entity_norm}@{f}")
+                if ent.priority > best_priority[i]:
+                    best_priority[i] = ent.priority
+
+        stats[ent.entity_norm] = {
+            "entity_norm": ent.entity_norm,
+            "entity_type": ent.entity_type,
+            "priority": ent.priority,
+            "requires_coevidence": ent.requires_coevidence,
+            "per_term_cap": ent.per_term_cap or "",
+            "hit_count": len(hit_any),
+            "hit_field_breakdown": ",".join(f"{k}:{v}" for k, v in field_breakdown.items() if v),
+        }
 
     out["entity_override_hit"] = [1 if x else 0 for x in hit_entities]
     out["entity_override_best_priority"] = best_priority
@@ -12,10 +12,16 @@ from __future__ import annotations
 
 import argparse
 import re
+import sys
 from pathlib import Path
 
 import pandas as pd
 
+# scripts/ is not a Python package; add it to sys.path for local imports
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from file_walk import walk_files  # noqa: E402
+
 
 def norm(s: str) -> str:
     s = "" if s is None else str(s)
@@ -97,6 +103,7 @@ def extract_one_file(path: Path) -> pd.DataFrame:
 
 def iter_inputs(values: list[str]) -> list[Path]:
     out: list[Path] = []
+    exts = {".xls", ".xlsx"}
     for v in values:
         v = str(v)
         p = Path(v).expanduser()
@@ -105,11 +112,10 @@ def iter_inputs(values: list[str]) -> list[Path]:
             out.extend(Path().glob(v))
             continue
         if p.is_dir():
-            out.extend([x for x in p.rglob("*") if x.is_file()])
+            out.extend(walk_files(p, exts, skip_hidden=False))
         else:
             out.append(p)
 
-    exts = {".xls", ".xlsx"}
     out = [p for p in out if p.exists() and p.suffix.lower() in exts]
 
     # de-dupe
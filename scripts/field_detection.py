@@ -22,19 +22,27 @@ from pathlib import Path
 
 
 _NON_ALNUM = re.compile(r"[^0-9a-z]+")
-_WS = re.compile(r"\s+")
+
+
+class _CombiningMarks(dict):
+    """str.translate table deleting combining marks; each code point is classified once, on first use."""
+
+    def __missing__(self, cp: int) -> int | None:
+        self[cp] = None if unicodedata.combining(chr(cp)) else cp
+        return self[cp]
+
+
+_STRIP_COMBINING = _CombiningMarks()
 
 
 def strip_accents(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s)
-    return "".join(ch for ch in s if not unicodedata.combining(ch))
+    return unicodedata.normalize("NFKD", s).translate(_STRIP_COMBINING)
 
 
 def norm_header(s: str) -> str:
     s = "" if s is None else str(s)
     s = strip_accents(s.casefold())
-    s = _NON_ALNUM.sub(" ", s)
-    s = _WS.sub(" ", s).strip()
+    s = _NON_ALNUM.sub(" ", s).strip()
     return s
 
 
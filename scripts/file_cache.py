@@ -0,0 +1,89 @@
+"""Per-input-file result cache shared by the audit/report scripts.
+
+- open_cache: a script's cache dir for this run, root/<name>/<fingerprint>
+- cached_call: fn(*args), pickled and reused while the input file's (mtime, size) are unchanged
+
+The fingerprint covers the code of every scripts/*.py module, the versions of the libraries in
+_LIBS and the caller's settings, so changing any of them starts a fresh dir.
+
+Eviction
+- open_cache deletes the dirs <name> left under earlier fingerprints; two runs with different
+  settings sharing one root therefore evict each other.
+- each call (one args tuple) owns one slot, so a changed input file overwrites its old result.
+- slots of inputs a later run no longer reads stay until the next fingerprint change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+from collections.abc import Callable
+from importlib import metadata
+from pathlib import Path
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# libraries whose release can change what the scripts read from a file
+_LIBS = ("numpy", "openpyxl", "pandas", "pyarrow", "python-calamine", "pyxlsb", "xlrd")
+
+
+def fingerprint(*settings: object) -> str:
+    """Digest of the scripts' code, the _LIBS versions, the Python version and repr(settings)."""
+    h = hashlib.sha1()
+    for p in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        h.update(p.name.encode())
+        h.update(p.read_bytes())
+    for lib in _LIBS:
+        try:
+            version = metadata.version(lib)
+        except metadata.PackageNotFoundError:
+            version = "-"
+        h.update(f"{lib}={version};".encode())
+    h.update(sys.version.encode())
+    h.update(repr(settings).encode())
+    return h.hexdigest()
+
+
+def open_cache(root: Path, name: str, *settings: object) -> Path:
+    """root/name/<fingerprint(*settings)>, created if needed; name's dirs for other fingerprints are removed."""
+    base = root / name
+    cache_dir = base / fingerprint(*settings)[:20]
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for d in base.iterdir():
+        if d != cache_dir and d.is_dir():
+            shutil.rmtree(d, ignore_errors=True)
+    return cache_dir
+
+
+def cached_call(fn: Callable[..., T], *args, cache_dir: Path, src: int = 0) -> T:
+    """fn(*args), reusing the result an earlier run pickled while args[src]'s (mtime, size) are unchanged.
+
+    repr(args) names the slot, so args should be paths, strings and numbers.
+    """
+    try:
+        st = Path(args[src]).stat()
+    except OSError:
+        return fn(*args)
+    stamp = (st.st_mtime_ns, st.st_size)
+    slot = cache_dir / (hashlib.sha1(repr(args).encode()).hexdigest() + ".pkl")
+    try:
+        with open(slot, "rb") as f:
+            saved, result = pickle.load(f)
+        if saved == stamp:
+            return result
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError, ValueError):
+        # missing, torn or unreadable slot: recompute and overwrite it
+        pass
+    result = fn(*args)
+    tmp = slot.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, slot)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+    return result
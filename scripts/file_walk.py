@@ -0,0 +1,32 @@
+"""Shared directory walker for the audit/extract scripts.
+
+- walk_files: files under a root with a wanted suffix, in Path.rglob("*") order, via os.scandir
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+
+def walk_files(root: Path, exts: set[str], *, skip_hidden: bool = True) -> Iterator[Path]:
+    """Files under root with a suffix in exts, skipping hidden dirs unless told not to; same order as rglob("*")."""
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        if not (skip_hidden and e.name.startswith(".")):
+                            subdirs.append(e.path)
+                        continue
+                    dot = e.name.rfind(".")
+                    if dot > 0 and e.name[dot:].lower() in exts and e.is_file():
+                        yield Path(e.path)
+                except OSError:
+                    continue
+    except OSError:
+        return
+    for d in subdirs:
+        yield from walk_files(d, exts, skip_hidden=skip_hidden)
@@ -15,11 +15,17 @@ Notes
 from __future__ import annotations
 
 import argparse
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
 import pandas as pd
 
+# scripts/ is not a Python package; add it to sys.path for local imports
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from file_walk import walk_files  # noqa: E402
+
 
 @dataclass
 class Hit:
@@ -31,17 +37,17 @@ class Hit:
 
 def iter_candidate_files(paths: list[str]) -> list[Path]:
     out: list[Path] = []
+    exts = {".csv", ".xls", ".xlsx"}
     for raw in paths:
         p = Path(raw).expanduser()
         if any(ch in raw for ch in ["*", "?", "["]):
             out.extend(Path().glob(raw))
             continue
         if p.is_dir():
-            out.extend([x for x in p.rglob("*") if x.is_file()])
+            out.extend(walk_files(p, exts, skip_hidden=False))
         else:
             out.append(p)
 
-    exts = {".csv", ".xls", ".xlsx"}
     out = [p for p in out if p.exists() and p.suffix.lower() in exts]
     # de-dupe
     seen = set()
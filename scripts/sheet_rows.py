@@ -0,0 +1,20 @@
+"""Shared helpers for the openpyxl read-only header peeks.
+
+- OPENPYXL_READ_ERRORS: what openpyxl raises on a workbook it cannot read
+
+Sheet data itself is read with pandas (xl.parse); the peeks only decide which sheets need it.
+"""
+
+from __future__ import annotations
+
+import zipfile
+import zlib
+
+# openpyxl's errors on corrupt workbooks: bad or encrypted zip members (BadZipFile, zlib.error,
+# EOFError, RuntimeError), malformed XML (SyntaxError), missing parts (KeyError) and odd cell or
+# part values; the read-only header peeks catch these and leave the file to pandas. Callers only
+# pass .xlsx/.xlsm paths, so openpyxl's InvalidFileException (unsupported suffix) cannot occur.
+OPENPYXL_READ_ERRORS = (
+    OSError, EOFError, KeyError, ValueError, TypeError, RuntimeError, SyntaxError,
+    zipfile.BadZipFile, zlib.error,
+)
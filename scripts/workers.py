@@ -0,0 +1,21 @@
+"""Process-pool size shared by the scripts that scan files in parallel.
+
+- pool_workers: the worker count for a --workers value over n files (1 = scan serially)
+"""
+
+from __future__ import annotations
+
+import os
+
+# below this many files, starting the pool (each worker re-imports pandas) costs more than the
+# scans it spreads out; above the template set's default --limit of 40
+SERIAL_BELOW_FILES = 64
+
+
+def pool_workers(requested: int, n_files: int) -> int:
+    """requested when set (> 0); else 1 below SERIAL_BELOW_FILES files and the CPU count above."""
+    if requested > 0:
+        return requested
+    if n_files < SERIAL_BELOW_FILES:
+        return 1
+    return min(os.cpu_count() or 1, n_files)
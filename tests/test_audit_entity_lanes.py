@@ -0,0 +1,125 @@
+import re
+import zipfile
+
+import openpyxl
+from openpyxl.chart import BarChart, Reference
+
+from scripts.audit_entity_lanes import (
+    Entity,
+    _prep_cell,
+    build_entity_index,
+    guess_provider,
+    header_may_have_candidates,
+    match_all,
+    match_entity,
+    norm_text,
+    peek_excel_headers,
+    scan_file,
+    scan_values,
+)
+
+
+def _ent(norm: str, priority: int = 5) -> Entity:
+    return Entity(entity_raw=norm, entity_norm=norm, entity_type="PERSON", priority=priority)
+
+
+def test_norm_text_basic():
+    assert norm_text("  Dudu Falcão ") == "dudu falcao"
+    assert norm_text(None) == ""
+
+
+def test_all_tokens_required():
+    ent = _ent("zero quatro")
+    assert match_entity(ent, "Quatro, Zero") is True
+    assert match_entity(ent, "Zero") is False
+    assert match_entity(ent, "") is False
+
+
+def test_joined_form_only_for_high_priority():
+    assert match_entity(_ent("zero quatro", priority=5), "ZeroQuatro") is True
+    assert match_entity(_ent("zero quatro", priority=3), "ZeroQuatro") is False
+
+
+def test_dudu_requires_falcao():
+    ent = _ent("dudu falcao")
+    assert match_entity(ent, "Dudu Falcão") is True
+    assert match_entity(ent, "du du falcão") is True
+    assert match_entity(ent, "Dudu Nobre") is False
+
+
+def test_match_all_agrees_with_match_entity():
+    cells = ["Tagore", "TAGORE ASSAD, Outro", "ZeroQuatro", "xzeroquatro", "du du falcão", "Dudu Nobre", "", "nan", "Quatro Zero"]
+    ents = [_ent("tagore"), _ent("zero quatro"), _ent("zero"), _ent("quatro", priority=1), _ent("dudu falcao")]
+    index = build_entity_index(ents)
+    for c in cells:
+        expected = {e.entity_norm for e in ents if match_entity(e, c)}
+        assert match_all(index, _prep_cell(c)) == expected, c
+
+
+def test_scan_values_agrees_with_match_all():
+    cells = ["Tagore", "ZeroQuatro", "Quatro Zero", "du du falcão", "", "Tagore", "nan", "Zero"]
+    small = [_ent("tagore"), _ent("zero quatro"), _ent("zero"), _ent("dudu falcao")]
+    wide = small + [_ent(f"t{i} u{i}") for i in range(40)]  # > 64 vocab tokens: per-value path
+    for ents in (small, wide):
+        index = build_entity_index(ents)
+        expected = {}
+        for i, c in enumerate(cells):
+            for en in match_all(index, _prep_cell(c)):
+                expected.setdefault(en, []).append(i)
+        assert scan_values(index, cells) == expected
+
+
+def test_header_may_have_candidates():
+    assert header_may_have_candidates(["Qtd", "Autor/Compositor"]) is True
+    assert header_may_have_candidates(["Qtd", ""]) is True
+    assert header_may_have_candidates(["Qtd", "Valor"]) is False
+
+
+def test_guess_provider_keeps_list_priority():
+    assert guess_provider("/x/SBT/relatorio band.xlsx") == "band"
+    assert guess_provider("/x/globoplay/ubem.csv") == "globoplay"
+    assert guess_provider("/x/Canais Globo/a.xls") == "globo"
+    assert guess_provider("/x/luna/a.xls") == "other"
+
+
+
+def _scan(p, ents):
+    return scan_file(
+        p, entities=ents, index=build_entity_index(ents), max_sheets=5, max_rows=100, hits_cap=10, variants_cap=10
+    )
+
+
+def test_peek_ignores_stale_sheet_dimension(tmp_path):
+    src = tmp_path / "src.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.append(["Titulo", "Autor"])
+    wb.active.append(["x", "Tagore Assad"])
+    wb.save(src)
+    # some exporters write <dimension ref="A1"/> regardless of the sheet's real size
+    p = tmp_path / "stale.xlsx"
+    with zipfile.ZipFile(src) as zin, zipfile.ZipFile(p, "w") as zout:
+        for item in zin.infolist():
+            data = zin.read(item)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', data)
+            zout.writestr(item, data)
+
+    assert peek_excel_headers(p, max_sheets=5) == [("Sheet", ["Titulo", "Autor"])]
+    hits, _ = _scan(p, [_ent("tagore assad")])
+    assert [h["entity_norm"] for h in hits] == ["tagore assad"]
+
+
+def test_peek_skips_chartsheets(tmp_path):
+    p = tmp_path / "chart.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.title = "Dados"
+    wb.active.append(["Titulo", "Autor"])
+    wb.active.append(["x", "Tagore Assad"])
+    chart = BarChart()
+    chart.add_data(Reference(wb.active, min_col=1, min_row=1, max_row=2))
+    wb.create_chartsheet("Grafico").add_chart(chart)
+    wb.save(p)
+
+    assert peek_excel_headers(p, max_sheets=5) == [("Dados", ["Titulo", "Autor"])]
+    hits, _ = _scan(p, [_ent("tagore assad")])
+    assert [h["entity_norm"] for h in hits] == ["tagore assad"]
@@ -0,0 +1,138 @@
+import fnmatch
+import re
+import zipfile
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from scripts.audit_fornecedores_coverage import (
+    compile_exclude_globs,
+    excel_header_rows,
+    guess_provider,
+    is_excluded,
+    load_quarantine_index,
+    probe_excel,
+    read_csv_header,
+    safe_copy_to_quarantine,
+    walk_tree,
+)
+
+
+def test_compiled_excludes_agree_with_fnmatch():
+    globs = ["**/*__dup1.*", "**/staged/sync/**", "*.tmp", "*.tar.gz", "a[bc]*", "*?.x"]
+    excludes = compile_exclude_globs(globs)
+    assert excludes.suffixes == {".tmp"}
+    paths = ["/a/b.tmp", "/a/.tmp", "x.tmp/y", "a.tar.gz", "ab", "q/a.x", ".x", "/a/r__dup1.csv", "/x/staged/sync/a.csv", "/x/staged/sync"]
+    for p in paths:
+        assert is_excluded(p, excludes) == any(fnmatch.fnmatch(p, g) for g in globs), p
+    assert is_excluded("/a/b.csv", compile_exclude_globs([])) is False
+
+
+def test_walk_tree_lists_pruned_dirs_file_by_file(tmp_path):
+    for rel in ["a.csv", "staged/sync/b.csv", "staged/sync/deep/c.txt", "staged/d.csv", "z/e.xlsx"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("x")
+    globs = ["**/staged/sync/**"]
+    walked = list(walk_tree(tmp_path, compile_exclude_globs(globs)))
+
+    assert sorted(p for p, _ in walked) == sorted(p for p in tmp_path.rglob("*") if p.is_file())
+    assert {p.name for p, pruned in walked if pruned} == {"b.csv", "c.txt"}
+    assert all(is_excluded(p, compile_exclude_globs(globs)) for p, pruned in walked if pruned)
+
+
+def test_guess_provider_keeps_list_priority():
+    assert guess_provider("/x/SBT/relatorio band.xlsx") == "band"
+    assert guess_provider("/x/globoplay/ecad.csv") == "globoplay"
+    assert guess_provider("/x/Canal Brasil/a.xls") == "canalbrasil"
+    assert guess_provider("/x/luna/a.xls") == "other"
+
+
+def test_excel_header_rows_reads_only_the_header(tmp_path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Relatorio"
+    ws.append(["Obra", 2.0])
+    ws.append(["x", "y"])
+    wb.create_sheet("Vazia")
+    path = tmp_path / "r.xlsx"
+    wb.save(path)
+
+    assert excel_header_rows(path, max_sheets=5, max_rows=25) == (["Relatorio", "Vazia"], [["Obra", "2"], []])
+    pr = probe_excel(path, {"obra"}, {"relatorio"}, max_sheets=5, max_rows=25)
+    assert (pr.parse_status, pr.sheets_count, pr.header_hit, pr.sheetname_hit) == ("ok", 2, True, True)
+
+
+@pytest.mark.parametrize(
+    "header", [["Obra", None, "Autor"], ["Obra", "#N/A"], ["Obra", " "], ["Obra", 1, True], ["Obra", "Autor"]]
+)
+def test_excel_header_rows_defers_generated_names_to_pandas(tmp_path, header):
+    wb = openpyxl.Workbook()
+    wb.active.append(header)
+    wb.active.append(["x", "y", "z"])
+    path = tmp_path / "r.xlsx"
+    wb.save(path)
+
+    assert excel_header_rows(path, max_sheets=5, max_rows=25) is None
+    # "unnamed" / ".1" can only hit the names pandas makes up for these columns
+    assert probe_excel(path, {"unnamed", ".1"}, set(), max_sheets=5, max_rows=25).header_hit is True
+
+
+def test_excel_header_rows_ignores_stale_dimension(tmp_path):
+    wb = openpyxl.Workbook()
+    wb.active.append(["Titulo", "Autor"])
+    wb.active.append(["x", "y"])
+    src = tmp_path / "src.xlsx"
+    wb.save(src)
+    # some exporters write <dimension ref="A1"/> regardless of the sheet's real size
+    path = tmp_path / "stale.xlsx"
+    with zipfile.ZipFile(src) as zin, zipfile.ZipFile(path, "w") as zout:
+        for item in zin.infolist():
+            data = zin.read(item)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', data)
+            zout.writestr(item, data)
+
+    assert excel_header_rows(path, max_sheets=5, max_rows=25) == (["Sheet"], [["Titulo", "Autor"]])
+    assert probe_excel(path, {"autor"}, set(), max_sheets=5, max_rows=25).header_hit is True
+
+
+@pytest.mark.parametrize(
+    ("data", "fast"),
+    [
+        ("Autor,Obra\n1,2\n\n1,\n", True),
+        ('\n\n"Autor, letra",Obra\n"1\n2",3\n', True),  # blank lines skipped; quoted newline
+        ("\ufeffAutor,Obra\n1,2\n", False),
+        ("Autor,Obra\n1,2,3\n1,2,3\n", False),  # implicit index column
+        ("Autor,Obra\n1,2\n1,2,3\n", False),  # too many fields
+        ('Autor,Obra\n"x,1\n', False),  # EOF inside string
+        ("Autor,,Autor\n1,2,3\n", False),  # blank and duplicate names
+        ("Autor\n1\n", False),
+        ("", False),
+    ],
+)
+def test_read_csv_header_defers_unusual_files_to_pandas(tmp_path, data, fast):
+    path = tmp_path / "a.csv"
+    path.write_text(data, encoding="utf-8")
+    header = read_csv_header(path, encoding="utf-8", sep=",")
+    assert (header is not None) == fast
+    if fast:
+        assert header == list(pd.read_csv(path, dtype=str, nrows=25, encoding="utf-8", sep=",").columns)
+
+
+def test_quarantine_reuses_previous_index_entries(tmp_path):
+    src = tmp_path / "bad.csv"
+    src.write_text("x", encoding="utf-8")
+    qdir = tmp_path / "q"
+    dest = safe_copy_to_quarantine(src, qdir)
+    assert dest.parent == qdir and dest.read_text(encoding="utf-8") == "x"
+    assert safe_copy_to_quarantine(src, qdir) == dest
+
+    old = qdir / "bad__0123456789ab.csv"
+    old.write_text("x", encoding="utf-8")
+    (qdir / "index.csv").write_text(f"src,dest,error\n{src},{old},boom\n", encoding="utf-8")
+    known = load_quarantine_index(qdir / "index.csv")
+    assert safe_copy_to_quarantine(src, qdir, known) == old
+    old.unlink()
+    assert safe_copy_to_quarantine(src, qdir, known) == dest
+    assert load_quarantine_index(tmp_path / "missing.csv") == {}
@@ -0,0 +1,31 @@
+import datetime
+from functools import partial
+
+import openpyxl
+import pandas as pd
+
+from scripts.audit_known_good_mapping import column_entity_hits, detect_best_header_row
+from scripts.audit_top_entities_frequency import default_entities, entity_match_in_text
+
+
+def test_column_entity_hits_agrees_with_entity_match_in_text():
+    entities = default_entities()
+    values = ["Dudu Falcão / Tagore", "", "  ", "DuduFalcao", "yago oproprio", "Zero-Quatro", "tagore", "Olegário"]
+    expected = {e.entity_norm for e in entities if any(str(v).strip() and entity_match_in_text(e, v) for v in values)}
+    assert column_entity_hits(entities, values) == expected
+    assert column_entity_hits(entities, ["", "sem credito"]) == set()
+
+
+def test_detect_best_header_row_skips_title_rows(tmp_path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "S"
+    for row in [["Relatorio", "NA", 3], [], [2.5, "N/A", True], ["Obra", "Autor", "ISRC"], ["x", 1, datetime.date(2024, 1, 2)]]:
+        ws.append(row)
+    path = tmp_path / "t.xlsx"
+    wb.save(path)
+
+    parse = partial(pd.ExcelFile(path).parse, "S", dtype=str)
+    syn_flat = frozenset({"obra", "autor"})
+    assert detect_best_header_row(parse, syn_flat, scan_rows=5)[0] == 3
+    assert detect_best_header_row(parse, syn_flat, scan_rows=2) == (None, 0)
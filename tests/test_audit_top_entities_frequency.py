@@ -0,0 +1,82 @@
+import pytest
+
+from scripts import audit_top_entities_frequency as te
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "\ufeff\"Autor\",Obra,x\nDudu Falcão,NA,1\n\"a,b\",\"l1\nl2\",\n,,\n",
+        "Autor;Compositor\nTagore;\nnull;x\n",
+        "Autor,Obra\n1,2\n1,2,3\n",  # too many fields: pandas decides
+        "Autor,Autor,\n1,2,3\n",  # mangled header: pandas decides
+        "Obra,x\n1,2\n",  # no candidate column
+    ],
+)
+def test_probe_csv_arrow_agrees_with_pandas(tmp_path, monkeypatch, data):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "a.csv"
+    path.write_text(data, encoding="utf-8")
+    got_cols, got, *got_fmt = te.probe_csv(path, max_rows=2)
+    monkeypatch.setattr(te, "pacsv", None)
+    cols, df, *fmt = te.probe_csv(path, max_rows=2)
+    assert (got_cols, got_fmt, len(got)) == (cols, fmt, len(df))
+    for c in te.detect_candidate_columns(cols):
+        assert got[c].tolist() == df[c].tolist()
+
+
+def test_probe_csv_arrow_rejects_invalid_utf8_outside_candidates(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "a.csv"
+    path.write_bytes("Autor,x\nTagore,a\nçã,".encode() + "ç\n".encode("latin-1"))
+    cols, df, enc, _ = te.probe_csv(path, max_rows=5)
+    assert enc == "latin-1" and df["Autor"].tolist() == ["Tagore", "Ã§Ã£"]
+
+
+def test_match_all_agrees_with_entity_match_tokens():
+    entities = te.default_entities() + [te.Entity("dudu", 4), te.Entity("falcao dudu", 3), te.Entity("", 5)]
+    index = te.build_entity_index(entities)
+    for text in ["Dudu Falcão / Tagore", "DuduFalcao", "xdudufalcaoy", "falcao, dudu", "zero-quatro", "", "yago oproprio"]:
+        toks = te.tokenize_norm(text)
+        tset, jt = set(toks), "".join(toks)
+        assert te.match_all(index, tset, jt) == {e for e in entities if te.entity_match_tokens(e, tset, jt)}, text
+
+
+def test_scan_file_reports_first_hits_per_column(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_text("Autor,Obra,x\nTagore,DuduFalcao,Tagore\nDudu Falcão,Tagore,\n", encoding="utf-8")
+    batches, sampling = te.scan_file(path, entities=te.default_entities(), max_sheets=5, max_rows=10)
+    firsts = {
+        "Autor": {"tagore": "Tagore", "dudu falcao": "Dudu Falcão"},
+        "Obra": {"dudu falcao": "DuduFalcao", "tagore": "Tagore"},
+    }
+    assert batches == [(["Autor", "Obra"], firsts)]
+    assert (sampling["rows_scanned"], sampling["columns_scanned"], sampling["stop_reason"]) == (2, 2, "ok")
+    assert te.scan_file(tmp_path / "missing.csv", entities=[], max_sheets=5, max_rows=10)[1]["stop_reason"] == "parse_error"
+
+
+def test_first_entity_matches_skips_only_cells_too_short_to_match():
+    entities = [te.Entity("tagore", 5), te.Entity("mc mc", 3)]
+    assert te.first_entity_matches(entities, ["tag", "mc", "", "Tagoré", "TAGORE"]) == {"mc mc": "mc", "tagore": "Tagoré"}
+    # NFKD can lengthen non-ASCII cells ("ﬁ" -> "fi"), so those always reach the matcher
+    assert te.first_entity_matches([te.Entity("fix", 3)], ["ﬁx"]) == {"fix": "ﬁx"}
+
+
+def test_candidate_columns_ignore_case_and_accents():
+    cols = ["INTÉRPRETE", "Títular", "Editôra", "nome_completo", "nome completo", "Ti\u0301tulo", "ISRC", 3]  # decomposed í
+    assert te.detect_candidate_columns(cols) == ["INTÉRPRETE", "Títular", "Editôra", "nome_completo", "Ti\u0301tulo"]
+    assert te.detect_title_columns(cols) == ["Ti\u0301tulo"]
+
+
+def test_main_stops_scanning_once_every_entity_is_capped(tmp_path, monkeypatch):
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.csv").write_text("Autor,x\nTagore,1\n", encoding="utf-8")
+    cov = tmp_path / "coverage.csv"
+    cov.write_text(f"file_path,included\n{tmp_path / 'a.csv'},Y\n{tmp_path / 'b.csv'},Y\n", encoding="utf-8")
+    monkeypatch.setattr(te, "default_entities", lambda: [te.Entity("tagore", 5)])
+    argv = ["x", "--coverage", str(cov), "--out-dir", str(tmp_path / "out"), "--hits-cap-per-entity", "1", "--workers", "1"]
+    monkeypatch.setattr("sys.argv", argv)
+    te.main()
+    lines = (tmp_path / "out" / "top_entity_sampling_coverage.txt").read_text(encoding="utf-8").splitlines()
+    assert [ln.rsplit("stop_reason=", 1)[1] for ln in lines] == ["ok", "cap_reached"]
+
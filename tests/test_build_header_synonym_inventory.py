@@ -0,0 +1,9 @@
+from scripts.build_header_synonym_inventory import FIELD_MATCH_RX, FIELD_RX
+
+
+def test_field_match_rx_keeps_field_rx_priority():
+    # "autor" sits left of "titulo", but title is listed first in FIELD_RX
+    for h in ["autor titulo", "data do show", "valor brl", "%", "canal\nisrc", "nome", ""]:
+        expected = next((k for k, rx in FIELD_RX.items() if rx.search(h)), None)
+        m = FIELD_MATCH_RX.match(h)
+        assert (m.lastgroup if m else None) == expected, h
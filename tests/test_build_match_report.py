@@ -0,0 +1,24 @@
+import pandas as pd
+import pytest
+
+from scripts import build_match_report as mr
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "\ufeffsource_file,title,tier\n/x/band.xlsx,\"a,b\",Gold\n/y.xls,\"l1\nl2\",NA\n",
+        "a,b\n007,1e5\nnull,\n",
+        "a,b\n1\n",  # too few fields: pandas pads
+        "a,a\n1,2\n",  # mangled header: pandas decides
+        "a\n \nx\n",  # one column
+    ],
+)
+def test_read_csv_str_agrees_with_pandas(tmp_path, monkeypatch, data):
+    path = tmp_path / "s.csv"
+    path.write_text(data, encoding="utf-8")
+    expected = pd.read_csv(path, dtype=str, low_memory=False).fillna("")
+    assert mr.read_csv_str(path).equals(expected)
+    monkeypatch.setattr(mr, "pacsv", None)
+    assert mr.read_csv_str(path).equals(expected)
+
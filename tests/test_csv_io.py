@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+from scripts.csv_io import read_plain_header, write_rows_csv
+
+
+def test_write_rows_csv_matches_to_csv(tmp_path):
+    for rows in [[], [{"a": 1, "b": "x,y", "c": None}, {"a": 22, "b": 'q"\nz', "c": 1.5}]]:
+        write_rows_csv(rows, tmp_path / "a.csv")
+        pd.DataFrame(rows).to_csv(tmp_path / "b.csv", index=False)
+        assert (tmp_path / "a.csv").read_bytes() == (tmp_path / "b.csv").read_bytes()
+
+
+@pytest.mark.parametrize(
+    ("data", "encoding", "plain"),
+    [
+        (b"\xef\xbb\xbfAutor;Obra\n1;2\n", "utf-8", True),
+        (b"\xef\xbb\xbfAutor;Obra\n1;2\n", "latin-1", False),  # BOM left in the first name
+        (b"Autor\n1\n", "utf-8", False),
+        (b"Autor;;Autor\n1;2;3\n", "utf-8", False),  # pandas renames blank and duplicate names
+        (b'"Au\ntor";Obra\n1;2\n', "utf-8", False),  # header spans two lines
+    ],
+)
+def test_read_plain_header_refuses_headers_pandas_rewrites(tmp_path, data, encoding, plain):
+    path = tmp_path / "a.csv"
+    path.write_bytes(data)
+    if plain:
+        expected = list(pd.read_csv(path, dtype=str, encoding=encoding, sep=";").columns)
+        assert read_plain_header(path, encoding=encoding, sep=";") == expected
+    else:
+        with pytest.raises(ValueError):
+            read_plain_header(path, encoding=encoding, sep=";")
@@ -68,3 +68,17 @@ def test_compute_entity_override_hits_fields():
     assert "tagore" in out.loc[0, "entity_override_entities"]
     assert "dudu falcao" in out.loc[1, "entity_override_entities"]
     assert len(stats) == 3
+
+
+def test_compute_entity_override_hits_follow_row_position_not_label():
+    df = pd.DataFrame({"artist": ["X", "Tagore", "Dudu / Falcão"]}, index=[2, 0, 1])
+    ovs = [
+        EntityOverride("tagore", "tagore", "PERSON", 5, 0, None, ""),
+        EntityOverride("falcao dudu", "falcao dudu", "PERSON", 3, 0, None, ""),
+    ]
+
+    out, stats = compute_entity_override_hits(df, ovs, search_fields=["artist"])
+
+    assert out["entity_override_entities"].tolist() == ["", "tagore", "falcao dudu"]
+    assert out["entity_override_best_priority"].tolist() == [0, 5, 3]
+    assert stats["hit_count"].tolist() == [1, 1]
@@ -0,0 +1,36 @@
+from scripts.file_cache import cached_call, open_cache
+
+
+def test_cached_call_reuses_until_input_or_settings_change(tmp_path):
+    src = tmp_path / "a.csv"
+    src.write_text("Autor\nTagore\n", encoding="utf-8")
+    calls = []
+
+    def compute(prov, p):
+        calls.append(p)
+        return {"n": len(calls)}
+
+    cache_dir = open_cache(tmp_path / ".cache", "audit", {"max_rows": 10})
+    assert cached_call(compute, "band", src, cache_dir=cache_dir, src=1) == {"n": 1}
+    assert cached_call(compute, "band", src, cache_dir=cache_dir, src=1) == {"n": 1}
+    assert cached_call(compute, "sbt", src, cache_dir=cache_dir, src=1) == {"n": 2}
+    # a changed input overwrites its slot instead of adding one
+    src.write_text("Autor\nTagore Assad\n", encoding="utf-8")
+    assert cached_call(compute, "band", src, cache_dir=cache_dir, src=1) == {"n": 3}
+    assert len(list(cache_dir.iterdir())) == 2
+    # new settings get a new dir; the old one is removed, other scripts' dirs are kept
+    other = open_cache(tmp_path / ".cache", "report")
+    fresh = open_cache(tmp_path / ".cache", "audit", {"max_rows": 20})
+    assert cached_call(compute, "band", src, cache_dir=fresh, src=1) == {"n": 4}
+    assert not cache_dir.exists() and other.exists()
+
+
+def test_cached_call_recomputes_unreadable_slots(tmp_path):
+    src = tmp_path / "a.csv"
+    src.write_text("Autor\n", encoding="utf-8")
+    cache_dir = open_cache(tmp_path / ".cache", "audit")
+    assert cached_call(len, str(src), cache_dir=cache_dir) == len(str(src))
+    (slot,) = cache_dir.iterdir()
+    # a pickle naming a module that no longer exists raises ModuleNotFoundError on load
+    slot.write_bytes(b"cgone_module\nthing\n.")
+    assert cached_call(len, str(src), cache_dir=cache_dir) == len(str(src))
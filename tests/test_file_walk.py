@@ -0,0 +1,11 @@
+from scripts.file_walk import walk_files
+
+
+def test_walk_files_matches_rglob_order(tmp_path):
+    for rel in ["x.XLSX", ".xlsx", "a/y.xls", "a/.h/q.csv", "a/n.txt", "b/k.csv"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("")
+    exts = {".csv", ".xls", ".xlsx"}
+    expected = [p for p in tmp_path.rglob("*") if p.is_file() and p.suffix.lower() in exts]
+    assert list(walk_files(tmp_path, exts, skip_hidden=False)) == expected
+    assert list(walk_files(tmp_path, exts)) == [p for p in expected if ".h" not in p.parts]
@@ -0,0 +1,10 @@
+from scripts.workers import SERIAL_BELOW_FILES, pool_workers
+
+
+def test_pool_workers_stays_serial_for_few_files(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 8)
+    assert pool_workers(0, SERIAL_BELOW_FILES - 1) == 1
+    assert pool_workers(0, SERIAL_BELOW_FILES) == 8
+    assert pool_workers(3, 2) == 3
+    monkeypatch.setattr("os.cpu_count", lambda: None)
+    assert pool_workers(0, 1000) == 1